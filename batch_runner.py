@@ -0,0 +1,190 @@
+"""CSC111 Project 1: Text Adventure Game - Batch Walkthrough Runner
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module checks many recorded walkthroughs at once. Each walkthrough is run through an
+AdventureGameSimulation and its id log is compared with the expected one. The scripts are spread over a
+pool of worker processes, each of which parses the game data file only once and shares the loaded World
+between all of the scripts it runs. With --shared-memory, the world is loaded once by this process into shared
+memory instead, and every worker attaches to that single copy.
+
+The scripts file has one JSON object per line:
+
+    {"name": "win_walkthrough", "start": 7, "commands": ["pickup cellphone", ...], "expected_log": [7, 7, ...]}
+
+"name" and "start" are optional (they default to the line number and 7). Run it as
+
+    python batch_runner.py walkthroughs.jsonl --data game_data.json --workers 4
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from adventure import load_world
+from proj1_simulation import AdventureGameSimulation
+from shared_world import SharedWorld, attach_world
+
+DEFAULT_START = 7
+DEFAULT_CHUNK_SIZE = 64
+
+
+@dataclass
+class Script:
+    """A recorded walkthrough to check.
+
+    Instance Attributes:
+        - name: a name identifying this script in the results
+        - start: the location id the walkthrough starts from
+        - commands: the commands of the walkthrough, in order
+        - expected_log: the location ids the walkthrough should visit
+    """
+    name: str
+    start: int
+    commands: list[str]
+    expected_log: list[int]
+
+
+@dataclass
+class ScriptResult:
+    """The result of running one Script.
+
+    Instance Attributes:
+        - name: the name of the script
+        - passed: whether the simulation visited exactly the expected locations
+        - actual_log: the id log the simulation produced, or None if it crashed
+        - error: a description of the exception the simulation raised, or None
+    """
+    name: str
+    passed: bool
+    actual_log: Optional[list[int]]
+    error: Optional[str] = None
+
+
+# The game data file used by this worker process, set up once by _init_worker.
+_worker_data_file = ''
+
+
+def load_scripts(filename: str) -> list[Script]:
+    """Return the scripts in the JSON lines file with the given filename."""
+    scripts = []
+    with open(filename, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            if line.strip():
+                record = json.loads(line)
+                scripts.append(Script(record.get('name', str(line_number)), record.get('start', DEFAULT_START),
+                                      record['commands'], record['expected_log']))
+    return scripts
+
+
+def run_script(script: Script, game_data_file: str) -> ScriptResult:
+    """Run script in a simulation of the game in game_data_file and compare the id log with the expected one.
+
+    A script that raises an exception fails, with the exception as its error.
+
+    >>> result = run_script(Script('nowhere', 999, ['go south'], [999]), 'game_data.json')
+    >>> result.passed, result.error.split(':')[0]
+    (False, 'ValueError')
+    """
+    try:
+        sim = AdventureGameSimulation(game_data_file, script.start, script.commands)
+        actual = sim.get_id_log()
+    except Exception as error:  # whatever a script raises fails that script, not the whole batch
+        return ScriptResult(script.name, False, None, f"{type(error).__name__}: {error}")
+    return ScriptResult(script.name, actual == script.expected_log, actual)
+
+
+def _init_worker(game_data_file: str, shared_name: Optional[str] = None) -> None:
+    """Load the World once for every script this worker process will run, or attach to it in the shared memory
+    segment with the given name if there is one."""
+    global _worker_data_file
+    _worker_data_file = game_data_file
+    if shared_name is not None:
+        attach_world(shared_name, game_data_file)
+    else:
+        load_world(game_data_file)
+
+
+def _run_chunk(scripts: list[Script]) -> list[ScriptResult]:
+    """Run a chunk of scripts in this worker process."""
+    return [run_script(script, _worker_data_file) for script in scripts]
+
+
+def run_batch(scripts: list[Script], game_data_file: str, workers: Optional[int] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE, shared: bool = False) -> Iterator[ScriptResult]:
+    """Run all scripts over a pool of worker processes and yield their results as they complete. If shared, the
+    world is loaded once into shared memory for every worker to attach to, instead of each worker loading it.
+
+    Results arrive in completion order, not in the order of scripts.
+    """
+    shared_world = SharedWorld(game_data_file, {script.start for script in scripts}) if shared else None
+    shared_name = None if shared_world is None else shared_world.name
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(game_data_file, shared_name)) as executor:
+            futures = [executor.submit(_run_chunk, scripts[i:i + chunk_size])
+                       for i in range(0, len(scripts), chunk_size)]
+            for future in as_completed(futures):
+                yield from future.result()
+    finally:
+        if shared_world is not None:
+            shared_world.close()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the batch runner command line and return its exit status (1 if any script failed)."""
+    parser = argparse.ArgumentParser(description="Check recorded walkthroughs against their expected id logs.")
+    parser.add_argument('scripts', help="JSON lines file of walkthroughs")
+    parser.add_argument('--data', default='game_data.json', help="game data file (default: game_data.json)")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes (default: CPUs)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"scripts sent to a worker at a time (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument('--quiet', action='store_true', help="only report failures and the summary")
+    parser.add_argument('--shared-memory', action='store_true',
+                        help="load the world once into shared memory for the workers, instead of once per worker")
+    args = parser.parse_args(argv)
+
+    scripts = load_scripts(args.scripts)
+    failed = 0
+    start = time.perf_counter()
+    for result in run_batch(scripts, args.data, args.workers, args.chunk_size, args.shared_memory):
+        if not result.passed:
+            failed += 1
+            reason = result.error or f"got {result.actual_log}"
+            print(f"FAIL {result.name}: {reason}", flush=True)
+        elif not args.quiet:
+            print(f"PASS {result.name}", flush=True)
+    elapsed = time.perf_counter() - start
+
+    rate = len(scripts) / elapsed if elapsed > 0 else float('inf')
+    print(f"{len(scripts) - failed}/{len(scripts)} passed in {elapsed:.2f}s ({rate:.0f} scripts/s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    sys.exit(main())
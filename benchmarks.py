@@ -0,0 +1,184 @@
+"""CSC111 Project 1: Text Adventure Game - Benchmarks
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module times the hot paths of the game: loading game data, stepping a GameEngine, building an
+AdventureGameSimulation and reading its id log, and adding and removing events in the event logs. Each
+benchmark runs against game_data.json and against synthetic worlds of the requested sizes.
+
+Results can be saved as a JSON baseline and later runs compared with it; a run fails (exit status 1) when any
+metric is slower than its baseline by more than the threshold.
+
+    python benchmarks.py --sizes 1000 10000 --save          # record bench_baseline.json
+    python benchmarks.py --sizes 1000 10000 --threshold 0.25  # compare with it
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Optional
+
+from adventure import AdventureGame, load_world
+from game_engine import GameEngine
+from proj1_event_logger import Event, EventList, ArrayEventList
+from proj1_simulation import AdventureGameSimulation
+from world_generator import generate_world
+
+DEFAULT_BASELINE = 'bench_baseline.json'
+DEFAULT_THRESHOLD = 0.2
+WALK_LENGTH = 2000
+EVENT_COUNT = 20000
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Return the shortest time, in seconds, that func took over repeat calls."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def random_walk(game_data_file: str, start: int, length: int, seed: int = 0) -> list[str]:
+    """Return length "go" commands that walk randomly from start through the world in game_data_file."""
+    world = load_world(game_data_file)
+    rng = random.Random(seed)
+    commands = []
+    loc_id = start
+    for _ in range(length):
+        moves = [c for c in world.locations[loc_id].available_commands if c.startswith("go ")]
+        command = rng.choice(moves)
+        commands.append(command)
+        loc_id = world.locations[loc_id].available_commands[command]
+    return commands
+
+
+def _run_engine(game_data_file: str, start: int, commands: list[str]) -> GameEngine:
+    """Play commands through a rendering GameEngine that cannot run out of moves."""
+    engine = GameEngine(game_data_file, start)
+    engine.moves_remaining = len(commands) + 1
+    for command in commands:
+        engine.step(command)
+    return engine
+
+
+def _event_churn(log_class: type, count: int) -> None:
+    """Add count events to a new log_class, taking back every third one as undo does."""
+    log = log_class()
+    log.add_event(Event(1, "start"))
+    for i in range(count):
+        log.add_event(Event(i % 50, "somewhere"), "go north")
+        if i % 3 == 2:
+            log.remove_last_event()
+    log.get_id_log()
+
+
+def world_benchmarks(label: str, game_data_file: str, start: int, commands: list[str],
+                     repeat: int) -> dict[str, float]:
+    """Return the load, step and simulation metrics of the world in game_data_file, played with commands."""
+    load_world(game_data_file)  # warm the cache so engines and simulations time the game, not the parse
+    engine_time = best_of(repeat, lambda: _run_engine(game_data_file, start, commands))
+    sim = AdventureGameSimulation(game_data_file, start, commands)
+    return {
+        f"load_game_data[{label}]": best_of(repeat, lambda: AdventureGame._load_game_data(game_data_file)),
+        f"step[{label}]": engine_time / len(commands),
+        f"simulation_init[{label}]":
+            best_of(repeat, lambda: AdventureGameSimulation(game_data_file, start, commands)),
+        f"simulation_id_log[{label}]": best_of(repeat, sim.get_id_log),
+    }
+
+
+def run_benchmarks(sizes: list[int], repeat: int, workdir: str) -> dict[str, float]:
+    """Run every benchmark, with synthetic worlds of the given sizes written to workdir, and return the metrics
+    (all in seconds; lower is better)."""
+    with open('walkthroughs.jsonl', 'r') as f:
+        walkthrough = json.loads(f.readline())['commands']
+    metrics = world_benchmarks('game_data', 'game_data.json', 7, walkthrough, repeat)
+    for size in sizes:
+        filename = os.path.join(workdir, f"grid_{size}.json")
+        start = generate_world(filename, size, 'grid')
+        metrics.update(world_benchmarks(f"grid_{size}", filename, start,
+                                        random_walk(filename, start, WALK_LENGTH), repeat))
+    for log_class in (EventList, ArrayEventList):
+        metrics[f"event_churn[{log_class.__name__}]"] = best_of(repeat, lambda: _event_churn(log_class, EVENT_COUNT))
+    return metrics
+
+
+def compare(metrics: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Return a description of every metric that is slower than its baseline by more than threshold.
+
+    >>> compare({'a': 1.3, 'b': 1.0, 'c': 5.0}, {'a': 1.0, 'b': 1.0}, 0.2)
+    ['a: 1.3s vs baseline 1s (+30%)']
+    """
+    regressions = []
+    for name, value in metrics.items():
+        old = baseline.get(name)
+        if old and value > old * (1 + threshold):
+            regressions.append(f"{name}: {value:.3g}s vs baseline {old:.3g}s ({(value / old - 1):+.0%})")
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the benchmark command line and return its exit status (1 if any metric regressed)."""
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths.")
+    parser.add_argument('--sizes', type=int, nargs='*', default=[1000, 10000],
+                        help="numbers of locations of the synthetic worlds (default: 1000 10000)")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per metric; the fastest counts (default: 5)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help=f"baseline file (default: {DEFAULT_BASELINE})")
+    parser.add_argument('--save', action='store_true', help="save this run as the baseline instead of comparing")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown before failing, as a fraction (default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        metrics = run_benchmarks(args.sizes, args.repeat, workdir)
+    width = max(len(name) for name in metrics)
+    for name, value in metrics.items():
+        print(f"{name:<{width}}  {value * 1e6:12.1f} us")
+
+    if args.save:
+        with open(args.baseline, 'w') as f:
+            json.dump({'python': platform.python_version(), 'metrics': metrics}, f, indent=2)
+        print(f"saved baseline to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --save to record one")
+        return 0
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)['metrics']
+    regressions = compare(metrics, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print(f"{len(regressions)} of {len(metrics)} metrics regressed beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    sys.exit(main())
@@ -0,0 +1,387 @@
+"""CSC111 Project 1: Text Adventure Game - Binary World Format
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module compiles a game data JSON file into a compact binary file, and loads such files back into
+a World. The binary file is memory-mapped, and the text of a location (its name, descriptions, commands and
+items), an item's description and a puzzle's texts are only decoded the first time they are read, so loading
+a large world neither parses nor keeps in memory text that a session never shows. The same encoding can be
+loaded from any buffer, such as the shared memory segment of a shared_world.SharedWorld.
+
+    python binary_world.py game_data.json game_data.advw
+
+File layout (all integers little-endian):
+    - header: magic b"ADVW", version, and the number of rows in each table below
+    - location table: id, name, brief and long description, first row and count of its commands, first row and
+      count of its item names
+    - command table: command, target location id
+    - location item table: item name
+    - item table: name, description, start position, target position, target points
+    - puzzle table: name, prompt, loc, win, next_loc, lose, dialogue, first row and count of its answers, kind,
+      command, requires, done
+    - answer table: answer
+    - string blob: every distinct string once, UTF-8 encoded
+Every string in a table is a (byte offset, byte length) reference into the string blob.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import mmap
+import struct
+import sys
+from functools import cached_property
+from types import MappingProxyType
+from typing import Iterator, Mapping, Optional
+
+from game_entities import Location, Item, Puzzle, World
+
+MAGIC = b"ADVW"
+VERSION = 2
+HEADER = struct.Struct('<4sH2x6I')
+LOCATION_ROW = struct.Struct('<i10I')
+LOCATION_ID = struct.Struct('<i')  # the first column of LOCATION_ROW
+COMMAND_ROW = struct.Struct('<2Ii')
+STRING_ROW = struct.Struct('<2I')
+ITEM_ROW = struct.Struct('<4I3i')
+PUZZLE_ROW = struct.Struct('<4Ii2Ii14I')
+
+
+class _WorldFile:
+    """The tables and string blob of a binary world, shared by all entities loaded from it.
+
+    The rows of the command, location item and answer tables are unpacked straight from the buffer when an
+    entity asks for them, so they are never copied while the buffer is shared between processes.
+    """
+    # Private Instance Attributes:
+    #   - _data: the buffer holding the binary world
+    #   - _start: the offset of the string blob in _data
+    #   - _shared: the strings decoded by shared_text, by offset
+    #   - _commands, _location_items, _answers: the offsets of the command, location item and answer tables
+    _data: mmap.mmap | memoryview
+    _start: int
+    _shared: dict[int, str]
+    _commands: int
+    _location_items: int
+    _answers: int
+
+    def __init__(self, data: mmap.mmap | memoryview, start: int, commands: int, location_items: int,
+                 answers: int) -> None:
+        self._data = data
+        self._start = start
+        self._shared = {}
+        self._commands = commands
+        self._location_items = location_items
+        self._answers = answers
+
+    def _rows(self, row: struct.Struct, table: int, first: int, count: int) -> Iterator[tuple]:
+        """Iterate over count rows, from row number first, of the table with rows of type row at offset table."""
+        start = table + first * row.size
+        return row.iter_unpack(self._data[start:start + count * row.size])
+
+    def commands(self, first: int, count: int) -> Iterator[tuple[int, int, int]]:
+        """Iterate over count rows of the command table, from row number first."""
+        return self._rows(COMMAND_ROW, self._commands, first, count)
+
+    def location_items(self, first: int, count: int) -> Iterator[tuple[int, int]]:
+        """Iterate over count rows of the location item table, from row number first."""
+        return self._rows(STRING_ROW, self._location_items, first, count)
+
+    def answers(self, first: int, count: int) -> Iterator[tuple[int, int]]:
+        """Iterate over count rows of the answer table, from row number first."""
+        return self._rows(STRING_ROW, self._answers, first, count)
+
+    def text(self, offset: int, length: int) -> str:
+        """Return the string at the given offset and length of the blob."""
+        start = self._start + offset
+        return str(self._data[start:start + length], 'utf-8')
+
+    def shared_text(self, offset: int, length: int) -> str:
+        """Return the string at the given offset and length of the blob, decoding each string only once.
+        For short strings used by many entities, such as commands and item names."""
+        text = self._shared.get(offset)
+        if text is None:
+            text = self._shared[offset] = self.text(offset, length)
+        return text
+
+
+def _lazy_text(column: int) -> cached_property:
+    """Return a cached property decoding the string referenced by the given column (and the next one) of the
+    entity's table row."""
+    def decode(self: LazyLocation | LazyItem | LazyPuzzle) -> str:
+        return self._file.text(self._row[column], self._row[column + 1])
+    return cached_property(decode)
+
+
+class LazyLocation(Location):
+    """A Location of a binary world, whose name, descriptions, commands and items are decoded when first read."""
+    # Private Instance Attributes:
+    #   - _file: the world file this location was loaded from
+    #   - _row: this location's row of the location table
+    _file: _WorldFile
+    _row: tuple[int, ...]
+
+    name = _lazy_text(1)
+    brief_description = _lazy_text(3)
+    long_description = _lazy_text(5)
+
+    def __init__(self, world_file: _WorldFile, row: tuple[int, ...]) -> None:
+        self._file = world_file
+        self._row = row
+        self.id_num = row[0]
+        self.visited = False
+
+    @cached_property
+    def available_commands(self) -> dict[str, int]:
+        """A mapping of commands to the location ids they lead to."""
+        first, count = self._row[7], self._row[8]
+        text = self._file.shared_text
+        return {text(offset, length): target for offset, length, target in self._file.commands(first, count)}
+
+    @cached_property
+    def items(self) -> list[str]:
+        """The names of the items present in this location."""
+        first, count = self._row[9], self._row[10]
+        return [self._file.shared_text(*ref) for ref in self._file.location_items(first, count)]
+
+
+class _LocationTable(Mapping[int, Location]):
+    """The locations of a binary world by id, each built from its row of the location table the first time it is
+    looked up, so a process only holds objects for the locations its sessions actually reach.
+
+    Locations are found by binary search over the id column when ids ascend through the table (as they do in
+    compiled and generated worlds), and through a mapping from id to row number otherwise.
+    """
+    # Private Instance Attributes:
+    #   - _file: the world file the locations are loaded from
+    #   - _data: the buffer holding the binary world
+    #   - _table: the offset of the location table in _data
+    #   - _count: the number of rows of the location table
+    #   - _rows: a mapping from location id to row number, or None if ids ascend through the table
+    #   - _built: the locations built so far, by id
+    _file: _WorldFile
+    _data: mmap.mmap | memoryview
+    _table: int
+    _count: int
+    _rows: Optional[dict[int, int]]
+    _built: dict[int, LazyLocation]
+
+    def __init__(self, world_file: _WorldFile, data: mmap.mmap | memoryview, table: int, count: int) -> None:
+        self._file = world_file
+        self._data = data
+        self._table = table
+        self._count = count
+        self._built = {}
+        ids = list(self)
+        ascending = all(a < b for a, b in zip(ids, ids[1:]))
+        self._rows = None if ascending else {loc_id: row for row, loc_id in enumerate(ids)}
+
+    def _id(self, row: int) -> int:
+        """Return the id of the location in the given row."""
+        return LOCATION_ID.unpack_from(self._data, self._table + row * LOCATION_ROW.size)[0]
+
+    def _row(self, loc_id: int) -> Optional[int]:
+        """Return the row number of the location with the given id, or None if there is none."""
+        if self._rows is not None:
+            return self._rows.get(loc_id)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._id(middle) < loc_id:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < self._count and self._id(low) == loc_id else None
+
+    def __getitem__(self, loc_id: int) -> LazyLocation:
+        location = self._built.get(loc_id)
+        if location is None:
+            row = self._row(loc_id) if isinstance(loc_id, int) else None
+            if row is None:
+                raise KeyError(loc_id)
+            row_values = LOCATION_ROW.unpack_from(self._data, self._table + row * LOCATION_ROW.size)
+            location = self._built[loc_id] = LazyLocation(self._file, row_values)
+        return location
+
+    def __iter__(self) -> Iterator[int]:
+        table = self._table
+        return (row[0] for row in LOCATION_ROW.iter_unpack(self._data[table:table + self._count * LOCATION_ROW.size]))
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class LazyItem(Item):
+    """An Item of a binary world, whose description is decoded when first read."""
+    # Private Instance Attributes:
+    #   - _file: the world file this item was loaded from
+    #   - _row: this item's row of the item table
+    _file: _WorldFile
+    _row: tuple[int, ...]
+
+    description = _lazy_text(2)
+
+    def __init__(self, world_file: _WorldFile, row: tuple[int, ...]) -> None:
+        self._file = world_file
+        self._row = row
+        self.name = world_file.shared_text(row[0], row[1])
+        self.start_position, self.target_position, self.target_points = row[4:7]
+
+
+class LazyPuzzle(Puzzle):
+    """A Puzzle of a binary world, whose texts are decoded when first read."""
+    # Private Instance Attributes:
+    #   - _file: the world file this puzzle was loaded from
+    #   - _row: this puzzle's row of the puzzle table
+    _file: _WorldFile
+    _row: tuple[int, ...]
+
+    prompt = _lazy_text(2)
+    win = _lazy_text(5)
+    lose = _lazy_text(8)
+    dialogue = _lazy_text(10)
+    kind = _lazy_text(14)
+    command = _lazy_text(16)
+    requires = _lazy_text(18)
+    done = _lazy_text(20)
+
+    def __init__(self, world_file: _WorldFile, row: tuple[int, ...]) -> None:
+        self._file = world_file
+        self._row = row
+        self.loc = row[4]
+        self.next_loc = row[7]
+        first, count = row[12], row[13]
+        self.answer = [world_file.text(*ref) for ref in world_file.answers(first, count)]
+
+
+def compile_world(json_filename: str, binary_filename: str) -> None:
+    """Compile the game data JSON file json_filename into the binary world file binary_filename."""
+    with open(binary_filename, 'wb') as f:
+        f.write(encode_world(json_filename))
+
+
+def encode_world(json_filename: str) -> bytes:
+    """Return the binary world of the game data JSON file json_filename."""
+    with open(json_filename, 'r') as f:
+        data = json.load(f)
+
+    blob = bytearray()
+    refs = {}
+
+    def ref(text: str) -> tuple[int, int]:
+        """Return the blob reference of text, adding it to the blob if it is not there yet."""
+        if text not in refs:
+            encoded = text.encode('utf-8')
+            refs[text] = (len(blob), len(encoded))
+            blob.extend(encoded)
+        return refs[text]
+
+    locations, commands, location_items = bytearray(), bytearray(), bytearray()
+    command_count = location_item_count = 0
+    for loc in data['locations']:
+        locations += LOCATION_ROW.pack(loc['id'], *ref(loc.get('name', '')), *ref(loc['brief_description']),
+                                       *ref(loc['long_description']), command_count, len(loc['available_commands']),
+                                       location_item_count, len(loc['items']))
+        for command, target in loc['available_commands'].items():
+            commands += COMMAND_ROW.pack(*ref(command), target)
+        for item_name in loc['items']:
+            location_items += STRING_ROW.pack(*ref(item_name))
+        command_count += len(loc['available_commands'])
+        location_item_count += len(loc['items'])
+
+    items = bytearray()
+    for item in data['items']:
+        items += ITEM_ROW.pack(*ref(item['name']), *ref(item['description']), item['start_position'],
+                               item['target_position'], item['target_points'])
+
+    puzzles, answers = bytearray(), bytearray()
+    answer_count = 0
+    for puzzle in data['puzzles']:
+        puzzles += PUZZLE_ROW.pack(*ref(puzzle.get('name', '')), *ref(puzzle['prompt']), puzzle['loc'],
+                                   *ref(puzzle['win']), puzzle['next_loc'], *ref(puzzle['lose']),
+                                   *ref(puzzle['dialogue']), answer_count, len(puzzle['answer']),
+                                   *ref(puzzle.get('kind', '')), *ref(puzzle.get('command', '')),
+                                   *ref(puzzle.get('requires', '')), *ref(puzzle.get('done', '')))
+        for answer in puzzle['answer']:
+            answers += STRING_ROW.pack(*ref(answer))
+        answer_count += len(puzzle['answer'])
+
+    header = HEADER.pack(MAGIC, VERSION, len(data['locations']), command_count, location_item_count,
+                         len(data['items']), len(data['puzzles']), answer_count)
+    return b''.join((header, locations, commands, location_items, items, puzzles, answers, blob))
+
+
+def is_binary_world(filename: str) -> bool:
+    """Return whether the file with the given filename is a binary world file."""
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_binary_world(filename: str) -> World:
+    """Return the World in the binary world file with the given filename.
+
+    Preconditions:
+        - is_binary_world(filename)
+    """
+    with open(filename, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return world_from_buffer(data, filename)
+
+
+def world_from_buffer(data: mmap.mmap | memoryview, source: str) -> World:
+    """Return the World in the binary world held by data, which is read from source (named in errors).
+
+    The World reads its text from data as it is needed, so data must stay open as long as the World is used.
+    """
+    magic, version, *counts = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{source} is not a version {VERSION} binary world")
+    n_locations, n_commands, n_location_items, n_items, n_puzzles, n_answers = counts
+
+    offset = HEADER.size
+    offsets = []
+    for row, count in ((LOCATION_ROW, n_locations), (COMMAND_ROW, n_commands), (STRING_ROW, n_location_items),
+                       (ITEM_ROW, n_items), (PUZZLE_ROW, n_puzzles), (STRING_ROW, n_answers)):
+        offsets.append(offset)
+        offset += row.size * count
+    world_file = _WorldFile(data, offset, offsets[1], offsets[2], offsets[5])
+
+    def rows(row: struct.Struct, section: int, count: int) -> Iterator[tuple]:
+        """Iterate over the count rows of type row of the given section."""
+        return row.iter_unpack(data[offsets[section]:offsets[section] + row.size * count])
+
+    item_rows = rows(ITEM_ROW, 3, n_items)
+    puzzle_rows = rows(PUZZLE_ROW, 4, n_puzzles)
+    locations = MappingProxyType(_LocationTable(world_file, data, offsets[0], n_locations))
+    items = {}
+    for row in item_rows:
+        item = LazyItem(world_file, row)
+        items[item.name] = item
+    puzzles = {row[4]: LazyPuzzle(world_file, row) for row in puzzle_rows}
+    return World(locations, items, puzzles)
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    if len(sys.argv) != 3:
+        print("usage: python binary_world.py GAME_DATA_JSON OUTPUT_FILE")
+        sys.exit(2)
+    compile_world(sys.argv[1], sys.argv[2])
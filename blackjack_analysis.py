@@ -0,0 +1,151 @@
+"""CSC111 Project 1: Text Adventure Game - Blackjack Analysis
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module estimates how winnable the fake blackjack minigame ("play with them") is. It plays millions
+of hands at once with NumPy, following exactly the rules of commands.Blackjack:
+
+    - your friend is dealt one number and you are dealt two, each uniform from 1 to 10
+    - you hit as long as your strategy says so; going over 21 loses at once and reaching exactly 21 wins at once
+    - when you stand, your friend draws one number, then keeps drawing while their sum is at most 16
+    - you win if your friend goes over 21 or if your sum is at least theirs
+
+A strategy is a threshold: hit while your sum is below it, stand once it is reached. The report gives the win
+rate (with its standard error) of every threshold.
+
+    python blackjack_analysis.py --hands 10000000 --seed 1
+
+NumPy is only needed by this analysis, not by the game; play_hand plays single hands in pure Python.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import math
+import random
+import time
+from typing import Optional
+
+from commands import DEALER_STANDS_ABOVE, random_1_to_10
+
+try:
+    import numpy as np
+except ImportError:  # only simulate needs NumPy
+    np = None
+
+BLACKJACK = 21
+THRESHOLDS = range(2, BLACKJACK + 1)  # every distinct strategy: standing at 2 never hits, at 21 hits until done
+BATCH_SIZE = 1_000_000  # hands simulated at a time, bounding memory to a few arrays of this length
+
+
+def play_hand(threshold: int, rng: random.Random) -> bool:
+    """Play one hand, hitting while the player's sum is below threshold, and return whether the player won.
+
+    >>> rng = random.Random(0)
+    >>> sum(play_hand(17, rng) for _ in range(10000)) / 10000 > 0.4
+    True
+    """
+    computer_sum = random_1_to_10(rng)
+    player_sum = random_1_to_10(rng) + random_1_to_10(rng)
+    while player_sum < threshold:
+        player_sum += random_1_to_10(rng)
+        if player_sum > BLACKJACK:
+            return False
+        if player_sum == BLACKJACK:
+            return True
+    computer_sum += random_1_to_10(rng)
+    while computer_sum <= DEALER_STANDS_ABOVE:
+        computer_sum += random_1_to_10(rng)
+    return computer_sum > BLACKJACK or player_sum >= computer_sum
+
+
+def _play_batch(threshold: int, hands: int, generator: np.random.Generator) -> int:
+    """Play hands hands with the given threshold at once and return how many the player won."""
+    computer = generator.integers(1, 11, hands, dtype=np.int8)
+    player = generator.integers(1, 11, hands, dtype=np.int8) + generator.integers(1, 11, hands, dtype=np.int8)
+    decided = np.zeros(hands, dtype=bool)  # hands already won or lost while hitting
+    won = np.zeros(hands, dtype=bool)
+    hitting = player < threshold
+    while hitting.any():
+        player[hitting] += generator.integers(1, 11, int(hitting.sum()), dtype=np.int8)
+        bust = hitting & (player > BLACKJACK)
+        blackjack = hitting & (player == BLACKJACK)
+        decided |= bust | blackjack
+        won |= blackjack
+        hitting &= ~decided & (player < threshold)
+
+    standing = ~decided
+    computer[standing] += generator.integers(1, 11, int(standing.sum()), dtype=np.int8)
+    drawing = standing & (computer <= DEALER_STANDS_ABOVE)
+    while drawing.any():
+        computer[drawing] += generator.integers(1, 11, int(drawing.sum()), dtype=np.int8)
+        drawing &= computer <= DEALER_STANDS_ABOVE
+    won |= standing & ((computer > BLACKJACK) | (player >= computer))
+    return int(won.sum())
+
+
+def simulate(hands: int, thresholds: range | list[int] = THRESHOLDS, seed: Optional[int] = None) -> dict[int, float]:
+    """Return the win rate of each threshold strategy over hands hands, simulated with NumPy from seed.
+
+    Raise ImportError if NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("simulate needs NumPy; install it with: pip install numpy")
+    generator = np.random.default_rng(seed)
+    rates = {}
+    for threshold in thresholds:
+        wins = 0
+        for start in range(0, hands, BATCH_SIZE):
+            wins += _play_batch(threshold, min(BATCH_SIZE, hands - start), generator)
+        rates[threshold] = wins / hands
+    return rates
+
+
+def report(rates: dict[int, float], hands: int) -> str:
+    """Return the win rates of the strategies as a table, best strategy marked.
+
+    >>> print(report({16: 0.5, 17: 0.25}, 100))
+    stand at   win rate   std error
+          16     50.00%       5.00% *
+          17     25.00%       4.33%
+    """
+    best = max(rates, key=rates.get)
+    lines = ["stand at   win rate   std error"]
+    for threshold, rate in rates.items():
+        error = math.sqrt(rate * (1 - rate) / hands)
+        lines.append(f"{threshold:>8}   {rate:>8.2%}   {error:>9.2%}" + (" *" if threshold == best else ""))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    parser = argparse.ArgumentParser(description="Estimate the win rates of strategies in the blackjack minigame.")
+    parser.add_argument('--hands', type=int, default=1_000_000, help="hands per strategy (default: 1000000)")
+    parser.add_argument('--seed', type=int, help="random seed")
+    parser.add_argument('--thresholds', type=int, nargs='*', default=list(THRESHOLDS),
+                        help="sums to stand at (default: every one from 2 to 21)")
+    args = parser.parse_args()
+
+    began = time.perf_counter()
+    win_rates = simulate(args.hands, args.thresholds, args.seed)
+    elapsed = time.perf_counter() - began
+    print(report(win_rates, args.hands))
+    print(f"{args.hands * len(args.thresholds)} hands in {elapsed:.1f}s")
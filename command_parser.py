@@ -0,0 +1,151 @@
+"""CSC111 Project 1: Text Adventure Game - Command Parser
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module lets players abbreviate commands. The commands of a location (and the menu options) are kept
+in a prefix trie, so any unambiguous prefix of a command resolves to it, in time proportional to the length of
+what was typed rather than to the number of commands:
+
+    - "pick" resolves to "pickup cellphone" when that is the only command starting with "pick"
+    - "go" commands can also be typed without "go": "north" (or "nor") resolves to "go north"
+    - single letters n, s, e, w, u and d stand for those directions: "n" resolves to "go north"
+
+The same trie completes partly typed commands, which the terminal client uses for tab completion.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from typing import Iterable, Optional
+
+from navigation import MOVE_PREFIX
+
+DIRECTIONS = {"n": "north", "s": "south", "e": "east", "w": "west", "u": "up", "d": "down"}
+_AMBIGUOUS = ""  # the command of a node with more than one command below it
+
+
+class _Node:
+    """A node of a CommandTrie: the keys with a common prefix."""
+    __slots__ = ('children', 'command', 'only')
+    # Instance Attributes:
+    #   - children: a mapping from the next character of a key to the node of the keys continuing with it
+    #   - command: the command whose key ends at this node, or None if no key ends here
+    #   - only: the command of every key below this node, or _AMBIGUOUS if they are not all the same command
+    children: dict[str, _Node]
+    command: Optional[str]
+    only: Optional[str]
+
+    def __init__(self) -> None:
+        self.children = {}
+        self.command = None
+        self.only = None
+
+
+def normalize(text: str) -> str:
+    """Return text as commands are compared: lower case, with single spaces between words.
+
+    >>> normalize("  Go   NORTH ")
+    'go north'
+    """
+    return " ".join(text.lower().split())
+
+
+class CommandTrie:
+    """A prefix trie of the commands that can be entered at a location, for resolving abbreviations.
+
+    Every command is a key of the trie, and so is every "go" command without its "go ". Each node knows whether
+    all the keys below it belong to one command, so resolving a prefix is a single walk down the trie.
+
+    >>> trie = CommandTrie(["go north", "go south", "submit project", "pickup cellphone", "score"])
+    >>> trie.resolve("n"), trie.resolve("pick"), trie.resolve("go s"), trie.resolve("sub"), trie.resolve("go")
+    ('go north', 'pickup cellphone', 'go south', 'submit project', None)
+    >>> trie.candidates("s")
+    ['go south', 'score', 'submit project']
+    """
+    # Private Instance Attributes:
+    #   - _root: the node of the empty prefix
+    #   - _aliases: a mapping from direction letter to the "go" command it stands for
+    _root: _Node
+    _aliases: dict[str, str]
+
+    def __init__(self, commands: Iterable[str]) -> None:
+        """Initialize the trie of the given commands."""
+        self._root = _Node()
+        self._aliases = {}
+        for command in commands:
+            self._insert(command, command)
+            if command.startswith(MOVE_PREFIX):
+                direction = command[len(MOVE_PREFIX):]
+                self._insert(direction, command)
+                for letter, name in DIRECTIONS.items():
+                    if name == direction:
+                        self._aliases[letter] = command
+
+    def _insert(self, key: str, command: str) -> None:
+        """Add key to this trie as a key of command."""
+        node = self._root
+        for char in key:
+            node.only = command if node.only in (None, command) else _AMBIGUOUS
+            node = node.children.setdefault(char, _Node())
+        node.only = command if node.only in (None, command) else _AMBIGUOUS
+        if node.command is None:
+            node.command = command
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        """Return the node of prefix, or None if no key starts with prefix."""
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def resolve(self, text: str) -> Optional[str]:
+        """Return the command text stands for: the command with text as a key, the direction text abbreviates, or
+        the only command with a key starting with text. Return None if there is no such command or more than one.
+        """
+        text = normalize(text)
+        if text in self._aliases:
+            return self._aliases[text]
+        node = self._find(text) if text else None
+        if node is None:
+            return None
+        if node.command is not None:
+            return node.command
+        return node.only or None
+
+    def candidates(self, text: str) -> list[str]:
+        """Return the commands with a key starting with text, in alphabetical order."""
+        text = normalize(text)
+        node = self._find(text)
+        if node is None:
+            return []
+        commands = set()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.command is not None:
+                commands.add(node.command)
+            stack.extend(node.children.values())
+        return sorted(commands)
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
@@ -0,0 +1,370 @@
+"""CSC111 Project 1: Text Adventure Game - Command Dispatch
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module turns the commands of a world into handler objects, so that a GameEngine carries out a
+command with a single dictionary lookup instead of comparing it against every command the game knows. Every
+location command becomes one of:
+
+    - Move: any command without a puzzle; the player just goes to the command's location (e.g. "go south")
+    - Pickup: "pickup <item>", which adds an item of the location to the inventory
+    - a puzzle handler, for the command named by the "command" of the location's puzzle in the game data. The
+      puzzle's "kind" chooses the handler from PUZZLE_KINDS:
+        - "submit": wins the game if the player has every point
+        - "reward": asks for an answer and gives the location's item for a right one (optionally "requires" an
+          item to try, and says "done" once solved)
+        - "call": a "reward" whose answer is a phone number, which may be dialled with dashes
+        - "door": asks for an answer and takes the player to next_loc for a right one
+        - "message": just says the puzzle's dialogue
+        - "blackjack": plays the fake blackjack minigame, then takes the player to next_loc
+        - "bonus": gives 10 extra moves once, taking the player to next_loc
+
+New puzzles of these kinds are added to a game by adding them to its game data; only a new kind of puzzle needs
+a new handler class here (registered in PUZZLE_KINDS).
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar, Mapping, Optional
+
+from command_parser import CommandTrie
+from game_entities import Location, Puzzle
+
+if TYPE_CHECKING:
+    from game_engine import GameEngine
+    from game_entities import World
+
+PICKUP_PREFIX = "pickup"
+HIT_PROMPT = 'if you wanna add another number say "hit" if not say "stand": '
+AGAIN_PROMPT = "Play again? y/n: "
+EXTRA_MOVES = 10
+DEALER_STANDS_ABOVE = 16  # your friend keeps drawing in blackjack while their sum is at most this
+
+
+def random_1_to_10(rng: Optional[random.Random] = None) -> int:
+    """
+    returns a random number between 1 and 10 inclusive for fake black jack minigame, drawn from rng (or from the
+    random module if rng is None)
+    """
+    return int(1 + (random.random() if rng is None else rng.random()) * 10)
+
+
+class Command:
+    """Something the player can do by entering a command at a location.
+
+    A GameEngine moves the player to the location the command leads to, then calls run. Commands are shared by
+    every session played in a world, so they keep no state of their own; whatever a session needs to remember
+    (such as a blackjack hand) lives in the answer handlers they give to GameEngine.ask.
+
+    Class Attributes:
+        - costs_move: whether the command uses up a move when it changes the player's location
+    """
+    costs_move: ClassVar[bool] = True
+
+    def run(self, engine: GameEngine) -> bool:
+        """Carry out this command in the session of engine and return whether it should be recorded as an event."""
+        raise NotImplementedError
+
+
+class Move(Command):
+    """A command that only takes the player to the location it leads to."""
+
+    def run(self, engine: GameEngine) -> bool:
+        """Nothing is left to do once the player has moved."""
+        return True
+
+
+MOVE = Move()  # every plain command shares this handler
+
+
+@dataclass(frozen=True)
+class Pickup(Command):
+    """A command picking up an item of its location.
+
+    Instance Attributes:
+        - item: the name of the item picked up
+    """
+    item: str
+
+    def run(self, engine: GameEngine) -> bool:
+        """Add the item to the inventory, unless it is already there."""
+        game = engine.game
+        if not game.pickup_item(game.get_item(self.item)):
+            engine.say("You have already pickedup this!")
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class PuzzleCommand(Command):
+    """The command starting the puzzle of its location.
+
+    Instance Attributes:
+        - puzzle: the puzzle this command starts
+    """
+    puzzle: Puzzle
+
+    @classmethod
+    def compile(cls, puzzle: Puzzle, location: Location) -> PuzzleCommand:
+        """Return the command starting puzzle, which is at location."""
+        return cls(puzzle)
+
+
+class Submit(PuzzleCommand):
+    """Submitting the project: the game is won if the player has every point."""
+
+    def run(self, engine: GameEngine) -> bool:
+        """Win the game if the player has every point, otherwise tell them what is missing."""
+        from game_engine import WIN_SCORE  # the engine dispatches through this module, so it is imported late
+        if engine.game.score == WIN_SCORE:
+            engine.say(self.puzzle.win)
+            engine.game.ongoing = False
+        else:
+            engine.say(self.puzzle.lose)
+        return True
+
+
+@dataclass(frozen=True)
+class Reward(PuzzleCommand):
+    """A question whose right answer earns the item of the puzzle's location.
+
+    Instance Attributes:
+        - item: the name of the item earned
+    """
+    item: str
+
+    @classmethod
+    def compile(cls, puzzle: Puzzle, location: Location) -> Reward:
+        """Return the command starting puzzle, which is at location and rewards the first item there."""
+        return cls(puzzle, location.items[0])
+
+    def run(self, engine: GameEngine) -> bool:
+        """Ask the question, unless it has been answered before or the player lacks the required item."""
+        puzzle, game = self.puzzle, engine.game
+        if game.inventory_has(self.item):
+            engine.say(puzzle.done)
+            return False
+        if puzzle.requires and not game.inventory_has(puzzle.requires):
+            engine.say(puzzle.dialogue)
+            return False
+        engine.ask(self.answer, puzzle.prompt)
+        return True
+
+    def answer(self, engine: GameEngine, answer: str) -> bool:
+        """Give the player the item for a right answer."""
+        if answer in self.puzzle.answer:
+            engine.say(self.puzzle.win)
+            return engine.game.pickup_item(engine.game.get_item(self.item))
+        engine.say(self.puzzle.lose)
+        return False
+
+
+class Call(Reward):
+    """A phone call whose right number earns the item of the puzzle's location.
+
+    Numbers are compared ignoring surrounding whitespace and dashes, so "416-978-4500" dials "4169784500".
+    """
+
+    def answer(self, engine: GameEngine, answer: str) -> bool:
+        """Give the player the item for the right number."""
+        return super().answer(engine, answer.strip().replace("-", ""))
+
+
+class Door(PuzzleCommand):
+    """A question whose right answer takes the player to the puzzle's next location."""
+
+    def run(self, engine: GameEngine) -> bool:
+        """Say the puzzle's dialogue and ask the question."""
+        engine.say(self.puzzle.dialogue)
+        engine.ask(self.answer, self.puzzle.prompt)
+        return True
+
+    def answer(self, engine: GameEngine, answer: str) -> bool:
+        """Let the player through for a right answer."""
+        if answer in self.puzzle.answer:
+            engine.say(self.puzzle.win)
+            engine.game.current_location_id = self.puzzle.next_loc
+        else:
+            engine.say(self.puzzle.lose)
+        return True
+
+
+class Message(PuzzleCommand):
+    """A command that only says the puzzle's dialogue."""
+
+    def run(self, engine: GameEngine) -> bool:
+        """Say the dialogue."""
+        engine.say(self.puzzle.dialogue)
+        return True
+
+
+class Blackjack(PuzzleCommand):
+    """The fake blackjack minigame: hands are dealt until the player does not want to play again, and then the
+    player goes on to the puzzle's next location."""
+    costs_move = False
+
+    def run(self, engine: GameEngine) -> bool:
+        """Say the rules and deal the first hand."""
+        engine.say(self.puzzle.prompt)
+        self._deal(engine)
+        return True
+
+    def _deal(self, engine: GameEngine) -> None:
+        """Deal a new hand."""
+        rng = engine.rng
+        computer_numbers = [random_1_to_10(rng)]
+        player_numbers = [random_1_to_10(rng), random_1_to_10(rng)]
+        if engine.render:
+            engine.say(f"you have {player_numbers} which adds up to {sum(player_numbers)}\n"
+                       f"your new friend first number is {computer_numbers}")
+        engine.ask(lambda e, pick: self._pick(e, pick, player_numbers, computer_numbers), HIT_PROMPT)
+
+    def _pick(self, engine: GameEngine, pick: str, player_numbers: list[int], computer_numbers: list[int]) -> bool:
+        """Handle a "hit" or "stand" for the hand of player_numbers against computer_numbers."""
+        if pick == "hit":
+            player_numbers.append(random_1_to_10(engine.rng))
+            if engine.render:
+                engine.say(f"you have {player_numbers} which adds up to {sum(player_numbers)}")
+            if sum(player_numbers) > 21:
+                engine.say(f"your friend won!\nyou had {player_numbers} ({sum(player_numbers)})")
+            elif sum(player_numbers) == 21:
+                engine.say(f"you won!\nyou had {player_numbers} (21)")
+            else:
+                engine.ask(lambda e, again: self._pick(e, again, player_numbers, computer_numbers), HIT_PROMPT)
+                return True
+        elif pick == "stand":
+            computer_numbers.append(random_1_to_10(engine.rng))
+            while sum(computer_numbers) <= DEALER_STANDS_ABOVE:
+                computer_numbers.append(random_1_to_10(engine.rng))
+            winner = "you" if sum(computer_numbers) > 21 or sum(player_numbers) >= sum(computer_numbers) \
+                else "your friend"
+            if engine.render:
+                engine.say(f"{winner} won!\n"
+                           f"they had {computer_numbers} ({sum(computer_numbers)}), and you had {player_numbers} "
+                           f"({sum(player_numbers)})")
+        else:
+            engine.ask(lambda e, again: self._pick(e, again, player_numbers, computer_numbers), HIT_PROMPT)
+            return True
+        engine.ask(self._play_again, AGAIN_PROMPT)
+        return True
+
+    def _play_again(self, engine: GameEngine, again: str) -> bool:
+        """Handle the answer to "Play again?"."""
+        if again == "y":
+            self._deal(engine)
+        elif again == "n":
+            engine.say(self.puzzle.dialogue)
+            engine.game.current_location_id = self.puzzle.next_loc
+        else:
+            engine.ask(self._play_again, AGAIN_PROMPT)
+        return True
+
+
+class Bonus(PuzzleCommand):
+    """Extra moves, which can be claimed once, taking the player to the puzzle's next location."""
+    costs_move = False
+
+    def run(self, engine: GameEngine) -> bool:
+        """Add the extra moves the first time the player claims them."""
+        if not engine.claimed_bonus:
+            engine.moves_remaining += EXTRA_MOVES
+            engine.claimed_bonus = True
+            engine.game.current_location_id = self.puzzle.next_loc
+        else:
+            engine.say(self.puzzle.lose)
+        return True
+
+
+# A mapping from the kind of a puzzle in the game data to the class of the command that starts it.
+PUZZLE_KINDS: dict[str, type[PuzzleCommand]] = {
+    'submit': Submit, 'reward': Reward, 'call': Call, 'door': Door, 'message': Message, 'blackjack': Blackjack,
+    'bonus': Bonus
+}
+
+
+def compile_location(location: Location, puzzle: Puzzle | None) -> dict[str, Command]:
+    """Return the command handlers of location, whose puzzle (if it has one) is puzzle.
+
+    >>> location = Location(1, 'a', 'a', {'go east': 2, 'pickup pen': 1, 'use door': 1}, ['pen'], False)
+    >>> door = Puzzle('Code? ', 1, 'Open!', 3, 'No.', ['42'], 'A door.', 'door', 'use door')
+    >>> commands = compile_location(location, door)
+    >>> commands['go east'] is MOVE, commands['pickup pen'], type(commands['use door']).__name__
+    (True, Pickup(item='pen'), 'Door')
+    """
+    commands = {}
+    for command in location.available_commands:
+        if puzzle is not None and command == puzzle.command and puzzle.kind in PUZZLE_KINDS:
+            commands[command] = PUZZLE_KINDS[puzzle.kind].compile(puzzle, location)
+        elif command.startswith(PICKUP_PREFIX) and location.items:
+            name = command[len(PICKUP_PREFIX):].strip()
+            commands[command] = Pickup(name if name in location.items else location.items[0])
+        else:
+            commands[command] = MOVE
+    return commands
+
+
+class CommandTable:
+    """The command handlers and command parsers of every location of a world.
+
+    Like a NavigationIndex, the handlers and parser of a location are built the first time it is asked about, or
+    all up front by precompute, so a world costs nothing extra to load until its commands are used.
+    """
+    # Private Instance Attributes:
+    #   - _world: the world whose commands are compiled
+    #   - _tables: a mapping from location id to its mapping from command to handler
+    #   - _parsers: a mapping from location id to the trie of its commands and the menu options
+    _world: World
+    _tables: dict[int, Mapping[str, Command]]
+    _parsers: dict[int, CommandTrie]
+
+    def __init__(self, world: World) -> None:
+        """Initialize the command table of world. No location is compiled yet."""
+        self._world = world
+        self._tables = {}
+        self._parsers = {}
+
+    def at(self, loc_id: int) -> Mapping[str, Command]:
+        """Return the mapping from command to handler of the location with the given id."""
+        table = self._tables.get(loc_id)
+        if table is None:
+            table = self._tables[loc_id] = compile_location(self._world.locations[loc_id],
+                                                            self._world.puzzles.get(loc_id))
+        return table
+
+    def parser(self, loc_id: int) -> CommandTrie:
+        """Return the trie of the commands of the location with the given id and the menu options."""
+        trie = self._parsers.get(loc_id)
+        if trie is None:
+            from game_engine import MENU
+            trie = self._parsers[loc_id] = CommandTrie([*self._world.locations[loc_id].available_commands, *MENU])
+        return trie
+
+    def precompute(self) -> None:
+        """Compile the handlers and parser of every location."""
+        for loc_id in self._world.locations:
+            self.at(loc_id)
+            self.parser(loc_id)
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
@@ -0,0 +1,312 @@
+"""CSC111 Project 1: Text Adventure Game - Random Walk Fuzzer
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module looks for crashes and broken invariants by playing the game at random. Each walk starts a
+headless GameEngine (which does not render its output, to go as fast as possible) and feeds it random input:
+
+    - the commands of the player's location, and abbreviations of them
+    - menu options, including storms of several undos in a row
+    - puzzle answers from the game data (right or wrong for the puzzle at hand), "hit", "stand", "y" and "n"
+    - "go to" a random location, and junk that is no command at all
+
+After every step the invariants of a session are checked: the score is never negative and always matches the
+inventory, the moves remaining are never negative, and the last event logged is at the player's location.
+A walk that raises an exception or breaks an invariant is replayed with fewer and fewer commands until no
+command can be removed without the failure going away, and the minimized walk is reported:
+
+    python fuzzer.py --walks 20000 --steps 200 --workers 4
+
+Walks are spread over a pool of worker processes, each of which loads the World once. A walk is determined by
+its seed alone (the blackjack minigame draws from a generator seeded with it too), so any failure can be replayed.
+With --shared-memory, the workers attach to one copy of the world in shared memory instead (see shared_world).
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from adventure import load_world
+from game_engine import MENU, GO_TO, GameEngine
+from game_entities import World
+from shared_world import SharedWorld, attach_world
+
+DEFAULT_START = 7
+DEFAULT_STEPS = 200
+DEFAULT_CHUNK_SIZE = 256
+MAX_UNDO_STORM = 12
+JUNK = ("", "   ", "xyzzy", "go", "go nowhere", "pickup", "submit", "GO NORTH", "undo undo", "\t", "12345")
+MINIGAME_ANSWERS = ("hit", "stand", "y", "n")
+
+
+@dataclass
+class Failure:
+    """A walk that crashed or broke an invariant.
+
+    Instance Attributes:
+        - seed: the seed of the walk
+        - start: the location id the walk started from
+        - commands: the input of the walk, up to and including the step that failed
+        - kind: what went wrong: the name of the exception raised, or "invariant"
+        - detail: the exception message, or the invariant that was broken
+    """
+    seed: int
+    start: int
+    commands: list[str]
+    kind: str
+    detail: str
+
+
+class Vocabulary:
+    """The input a fuzzer draws from for the walks in a world, gathered once per world."""
+    # Private Instance Attributes:
+    #   - _answers: every puzzle answer in the world, and the minigame answers
+    #   - _names: "go to" commands to every named location, and to nowhere
+    #   - _abbreviations: a mapping from location id to prefixes of its commands, built as locations are visited
+    _answers: tuple[str, ...]
+    _names: tuple[str, ...]
+    _abbreviations: dict[int, tuple[str, ...]]
+
+    def __init__(self, world: World) -> None:
+        """Gather the input for walks in world."""
+        answers = [answer for puzzle in world.puzzles.values() for answer in puzzle.answer]
+        self._answers = tuple(answers) + MINIGAME_ANSWERS
+        names = [GO_TO + location.name for location in world.locations.values() if location.name]
+        self._names = tuple(names) + (GO_TO + "nowhere",)
+        self._abbreviations = {}
+
+    def abbreviations(self, location_id: int, commands: Iterator[str]) -> tuple[str, ...]:
+        """Return prefixes of the commands of the location with the given id."""
+        prefixes = self._abbreviations.get(location_id)
+        if prefixes is None:
+            prefixes = tuple({command[:length] for command in commands for length in (1, 3, 5)})
+            self._abbreviations[location_id] = prefixes
+        return prefixes
+
+    def next_input(self, engine: GameEngine, rng: random.Random) -> list[str]:
+        """Return the next line, or burst of lines, to feed to engine."""
+        roll = rng.random()
+        if engine.waiting_for_answer and roll < 0.8:
+            return [rng.choice(self._answers)]
+        location = engine.game.get_location()
+        if roll < 0.55:
+            return [rng.choice(list(location.available_commands))]
+        if roll < 0.65:
+            return [rng.choice(self.abbreviations(location.id_num, iter(location.available_commands)))]
+        if roll < 0.72:
+            return ["undo"] * rng.randint(2, MAX_UNDO_STORM)
+        if roll < 0.82:
+            return [rng.choice(MENU[:-1])]
+        if roll < 0.88:
+            return [rng.choice(self._answers)]
+        if roll < 0.93:
+            return [rng.choice(self._names)]
+        if roll < 0.995:
+            return [rng.choice(JUNK)]
+        return ["quit"]
+
+
+def check_invariants(engine: GameEngine) -> Optional[str]:
+    """Return the invariant of a session that engine breaks, or None if it breaks none."""
+    game = engine.game
+    if game.score < 0:
+        return f"score is negative ({game.score})"
+    if game.score != sum(item.target_points for item in game.inventory):
+        return f"score {game.score} does not match the inventory"
+    if engine.moves_remaining < 0:
+        return f"moves remaining is negative ({engine.moves_remaining})"
+    last = engine.log.last
+    if last is None:
+        return "the event log is empty"
+    if game.ongoing and not engine.waiting_for_answer and last.id_num != game.current_location_id:
+        return f"the last event is at {last.id_num} but the player is at {game.current_location_id}"
+    return None
+
+
+def _feed(engine: GameEngine, line: str) -> Optional[tuple[str, str]]:
+    """Feed line to engine and return what went wrong, as a kind and detail, or None if nothing did."""
+    try:
+        engine.step(line)
+    except Exception as error:  # anything the game raises is what the fuzzer is looking for
+        return type(error).__name__, str(error)
+    broken = check_invariants(engine)
+    return None if broken is None else ("invariant", broken)
+
+
+def _new_engine(game_data_file: str, start: int, seed: int) -> GameEngine:
+    """Return a headless session for a walk with the given seed."""
+    return GameEngine(game_data_file, start, render=False, rng=random.Random(seed))
+
+
+def replay(game_data_file: str, start: int, seed: int, commands: list[str]) -> Optional[tuple[str, str]]:
+    """Feed commands to a new session of the walk with the given seed and return what went wrong, as a kind and
+    detail, or None if the whole walk ran without failing."""
+    engine = _new_engine(game_data_file, start, seed)
+    for line in commands:
+        if not engine.game.ongoing:
+            return None
+        problem = _feed(engine, line)
+        if problem is not None:
+            return problem
+    return None
+
+
+def walk(game_data_file: str, start: int, seed: int, steps: int, vocabulary: Vocabulary) \
+        -> tuple[int, Optional[Failure]]:
+    """Play a random walk of at most steps lines from the given seed, and return the number of steps taken and
+    the failure the walk ran into, if any."""
+    rng = random.Random(seed)
+    engine = _new_engine(game_data_file, start, seed)
+    commands = []
+    while len(commands) < steps and engine.game.ongoing:
+        for line in vocabulary.next_input(engine, rng):
+            commands.append(line)
+            problem = _feed(engine, line)
+            if problem is not None:
+                return len(commands), Failure(seed, start, commands, *problem)
+            if not engine.game.ongoing:
+                break
+    return len(commands), None
+
+
+def minimize(game_data_file: str, failure: Failure) -> Failure:
+    """Return failure with as few commands as still fail the same way.
+
+    Chunks of commands are removed, from half the walk down to single commands, keeping every removal after
+    which the replay still fails with the same kind of problem; this ends when no single command can be removed.
+    """
+    commands = failure.commands
+    kind, detail = failure.kind, failure.detail
+    chunk = max(len(commands) // 2, 1)
+    while True:
+        i = 0
+        while i < len(commands):
+            candidate = commands[:i] + commands[i + chunk:]
+            problem = replay(game_data_file, failure.start, failure.seed, candidate)
+            if problem is not None and problem[0] == kind:
+                commands, detail = candidate, problem[1]
+            else:
+                i += chunk
+        if chunk == 1:
+            break
+        chunk //= 2
+    return Failure(failure.seed, failure.start, commands, kind, detail)
+
+
+# The game data file, start and walk length of this worker process, and its vocabulary, set up by _init_worker.
+_worker_setup: tuple[str, int, int] = ('', DEFAULT_START, DEFAULT_STEPS)
+_worker_vocabulary: Optional[Vocabulary] = None
+
+
+def _init_worker(game_data_file: str, start: int, steps: int, shared_name: Optional[str] = None) -> None:
+    """Load the World once for every walk this worker process will play, or attach to it in the shared memory
+    segment with the given name if there is one."""
+    global _worker_setup, _worker_vocabulary
+    _worker_setup = (game_data_file, start, steps)
+    if shared_name is not None:
+        world = attach_world(shared_name, game_data_file)
+    else:
+        world = load_world(game_data_file)
+    _worker_vocabulary = Vocabulary(world)
+
+
+def _walk_chunk(seeds: range) -> tuple[int, list[Failure]]:
+    """Play the walks of a chunk of seeds in this worker process and return the number of steps they took and
+    their minimized failures."""
+    game_data_file, start, steps = _worker_setup
+    total = 0
+    failures = []
+    for seed in seeds:
+        taken, failure = walk(game_data_file, start, seed, steps, _worker_vocabulary)
+        total += taken
+        if failure is not None:
+            failures.append(minimize(game_data_file, failure))
+    return total, failures
+
+
+def fuzz(game_data_file: str, walks: int, first_seed: int = 0, start: int = DEFAULT_START,
+         steps: int = DEFAULT_STEPS, workers: Optional[int] = None,
+         chunk_size: int = DEFAULT_CHUNK_SIZE, shared: bool = False) -> Iterator[tuple[int, list[Failure]]]:
+    """Play walks random walks, with consecutive seeds from first_seed, over a pool of worker processes, and yield
+    the number of steps and the minimized failures of each chunk of walks as it completes. If shared, the world
+    is loaded once into shared memory for every worker to attach to, instead of each worker loading it."""
+    last_seed = first_seed + walks
+    shared_world = SharedWorld(game_data_file, (start,)) if shared else None
+    shared_name = None if shared_world is None else shared_world.name
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(game_data_file, start, steps, shared_name)) as executor:
+            futures = [executor.submit(_walk_chunk, range(seed, min(seed + chunk_size, last_seed)))
+                       for seed in range(first_seed, last_seed, chunk_size)]
+            for future in as_completed(futures):
+                yield future.result()
+    finally:
+        if shared_world is not None:
+            shared_world.close()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the fuzzer command line and return its exit status (1 if any walk failed)."""
+    parser = argparse.ArgumentParser(description="Play random walks through the game looking for failures.")
+    parser.add_argument('--data', default='game_data.json', help="game data file (default: game_data.json)")
+    parser.add_argument('--start', type=int, default=DEFAULT_START, help="starting location id (default: 7)")
+    parser.add_argument('--walks', type=int, default=10000, help="number of walks (default: 10000)")
+    parser.add_argument('--steps', type=int, default=DEFAULT_STEPS,
+                        help=f"most lines of input per walk (default: {DEFAULT_STEPS})")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first walk (default: 0)")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes (default: CPUs)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"walks sent to a worker at a time (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument('--shared-memory', action='store_true',
+                        help="load the world once into shared memory for the workers, instead of once per worker")
+    args = parser.parse_args(argv)
+
+    steps = 0
+    failures = {}
+    began = time.perf_counter()
+    for taken, chunk_failures in fuzz(args.data, args.walks, args.seed, args.start, args.steps, args.workers,
+                                      args.chunk_size, args.shared_memory):
+        steps += taken
+        for failure in chunk_failures:
+            signature = (failure.kind, failure.detail)
+            if signature not in failures or len(failure.commands) < len(failures[signature].commands):
+                failures[signature] = failure
+    elapsed = time.perf_counter() - began
+
+    for failure in failures.values():
+        print(json.dumps({'seed': failure.seed, 'start': failure.start, 'kind': failure.kind,
+                          'detail': failure.detail, 'commands': failure.commands}))
+    rate = steps / elapsed if elapsed > 0 else float('inf')
+    print(f"{args.walks} walks, {steps} steps in {elapsed:.2f}s ({rate:.0f} steps/s), "
+          f"{len(failures)} distinct failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    sys.exit(main())
@@ -0,0 +1,501 @@
+"""CSC111 Project 1: Text Adventure Game - Headless Engine
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the game rules of Project 1 as a headless engine. A session is advanced one
+line of input at a time with GameEngine.step, and the text the player would see is returned instead of
+printed, so games can be driven by scripts, simulations and servers as well as by the terminal client in
+the `adventure` module.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import random
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Optional
+
+from adventure import AdventureGame
+from game_entities import Location
+from instrumentation import Stats
+from proj1_event_logger import Event, EventList, ArrayEventList, JournalEventList
+from savegame import SavedSession, read_save, write_save, world_hash
+
+MENU = ("look", "inventory", "score", "undo", "log", "quit")  # Regular menu options available at each location
+WIN_SCORE = 20
+MAX_MOVES = 25
+ACTION_PROMPT = "\nEnter action (you have {} moves remaining): "
+RETRY_PROMPT = "\nEnter action: "
+STATS_COMMAND = "stats"  # menu option showing performance statistics, when they are being recorded
+GO_TO = "go to "  # prefix of the fast travel command, followed by a location name
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """The state of a session right after one of its events, which undo restores exactly.
+
+    Only what an event can change is kept, so a snapshot is a few numbers however long the game runs. The
+    inventory is shared rather than copied: between undos it only ever grows, so the items carried at an event
+    are the first inventory_size items of the inventory now (and the score is their points).
+
+    Instance Attributes:
+        - location_id: the id of the location the player was at
+        - moves_remaining: how many moves the player had left
+        - claimed_bonus: whether the extra moves had been claimed
+        - inventory_size: how many items the player was carrying
+    """
+    location_id: int
+    moves_remaining: int
+    claimed_bonus: bool
+    inventory_size: int
+
+
+@dataclass
+class StepResult:
+    """The outcome of feeding one line of input to a GameEngine.
+
+    Instance Attributes:
+        - output: the text the player sees after this step (empty if the engine is not rendering)
+        - prompt: the prompt to show when asking for the next line of input
+        - accepted: whether the line was accepted as a command or puzzle answer
+        - ongoing: whether the game is still running after this step
+    """
+    output: str
+    prompt: str
+    accepted: bool
+    ongoing: bool
+
+
+class GameEngine:
+    """A headless session of the text adventure game.
+
+    Puzzle answers, blackjack picks and play-again choices are ordinary lines of input: a command that needs an
+    answer leaves the engine waiting, and the next call to step is taken as that answer. Besides the commands of
+    each location, "go to <location name>" walks a shortest route there, spending one move per step of the route.
+
+    Instance Attributes:
+        - game: the AdventureGame holding the world, current location, inventory and score
+        - log: the events (locations reached) of this session, in order
+        - moves_remaining: how many moves the player can still make
+        - claimed_bonus: whether the extra moves have already been claimed
+        - render: whether step builds the text the player would see
+        - stats: where performance statistics are recorded, or None if they are not
+        - rng: the random number generator of the blackjack minigame, or None to use the random module
+        - save_on_quit: the file the session is saved to (with save) when the player quits, or None
+
+    Representation Invariants:
+        - moves_remaining >= 0
+        - not self.log.is_empty()
+
+    >>> engine = GameEngine('game_data.json', 7, render=False)
+    >>> for command in ["pickup cellphone", "go south", "go south", "call reciption", "416-978-4500"]:
+    ...     _ = engine.step(command)
+    >>> engine.log.get_id_log()
+    [7, 7, 13, 19, 19]
+    >>> engine.game.score, engine.moves_remaining
+    (18, 23)
+    >>> _ = engine.step("undo")
+    >>> engine.log.get_id_log(), engine.game.score, engine.moves_remaining
+    ([7, 7, 13, 19], 1, 23)
+    """
+    # Private Instance Attributes:
+    #   - _menu: the menu options accepted at every location
+    #   - _out: the pieces of text produced by the step in progress
+    #   - _pending: the handler waiting for the next line of input, or None if a new command is expected
+    #   - _pending_prompt: the prompt to show while _pending is waiting
+    #   - _action: the command whose effects are being resolved (it may span several steps)
+    #   - _picked: whether _action succeeded and should be recorded as an event
+    #   - _costs_move: whether _action uses up a move when it changes the player's location
+    #   - _opening: what the player sees before their first command
+    #   - _snapshots: the state of the session after each of the last len(_snapshots) events of log, in order;
+    #     no more are kept than the events undo can reach in log
+    #   - _game_data_file: the game data file this session is played in
+    game: AdventureGame
+    log: EventList | ArrayEventList | JournalEventList
+    moves_remaining: int
+    claimed_bonus: bool
+    render: bool
+    stats: Optional[Stats]
+    rng: Optional[random.Random]
+    save_on_quit: Optional[str]
+    _menu: tuple[str, ...]
+    _out: list[str]
+    _pending: Optional[Callable[[GameEngine, str], bool]]
+    _pending_prompt: str
+    _action: Optional[str]
+    _picked: bool
+    _costs_move: bool
+    _opening: StepResult
+    _snapshots: deque[Snapshot]
+    _game_data_file: str
+
+    def __init__(self, game_data_file: str, initial_location_id: int, render: bool = True,
+                 log: Optional[EventList | ArrayEventList | JournalEventList] = None,
+                 stats: Optional[Stats] = None, rng: Optional[random.Random] = None) -> None:
+        """Start a new session of the game in the given file at the given location.
+
+        The session is recorded in log, which should be empty, or in a new EventList if no log is given. If stats
+        is given, the session records its performance statistics there and accepts the "stats" menu option. If rng
+        is given, the blackjack minigame draws its numbers from it, so seeding it makes the session reproducible.
+
+        Preconditions:
+        - game_data_file is the filename of a valid game data JSON file
+        """
+        self.game = AdventureGame(game_data_file, initial_location_id)
+        self.log = EventList() if log is None else log
+        self.moves_remaining = MAX_MOVES
+        self.claimed_bonus = False
+        self.render = render
+        self.stats = stats
+        self.rng = rng
+        self.save_on_quit = None
+        self._menu = MENU if stats is None else MENU + (STATS_COMMAND,)
+        self._out = []
+        self._pending = None
+        self._pending_prompt = ""
+        self._action = None
+        self._picked = True
+        self._costs_move = True
+        self._snapshots = self._new_snapshots()
+        self._game_data_file = game_data_file
+        self._end_turn()
+        self._opening = self._result(True)
+
+    @classmethod
+    def load(cls, filename: str, game_data_file: str, render: bool = True,
+             log: Optional[EventList | ArrayEventList | JournalEventList] = None,
+             stats: Optional[Stats] = None, rng: Optional[random.Random] = None) -> GameEngine:
+        """Return a session carrying on from the one saved to the file with the given filename by save.
+
+        Raise ValueError if the file is not a save file, or if it was saved in a different game data file.
+        """
+        saved = read_save(filename)
+        if saved.world != world_hash(game_data_file):
+            raise ValueError(f"{filename} was saved in a different world than {game_data_file}")
+        engine = cls(game_data_file, saved.events[0][0], render, log, stats, rng)
+        engine._restore(saved)
+        return engine
+
+    def save(self, filename: str) -> None:
+        """Save this session to the file with the given filename, for load to carry on from later.
+
+        A session is also saved when the player quits (however they abbreviate "quit") if save_on_quit is set:
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'session.sav')
+        >>> engine = GameEngine('game_data.json', 7, render=False)
+        >>> engine.save_on_quit = path
+        >>> _ = engine.step("go south")
+        >>> engine.step("q").ongoing
+        False
+        >>> GameEngine.load(path, 'game_data.json', render=False).game.current_location_id
+        13
+
+        Preconditions:
+        - self.game.ongoing
+        - not self.waiting_for_answer
+        """
+        events = [(event.id_num, event.next_command, None, None, None) for event in self.log]
+        first = len(events) - len(self._snapshots)  # the earlier events are out of undo's reach
+        for i, snapshot in enumerate(self._snapshots, first):
+            events[i] = (*events[i][:2], snapshot.moves_remaining, snapshot.claimed_bonus, snapshot.inventory_size)
+        state = self.game.state
+        write_save(SavedSession(world_hash(self._game_data_file), state.current_location_id, sorted(state.visited),
+                                [item.name for item in state.inventory], self.moves_remaining, self.claimed_bonus,
+                                events), filename)
+
+    def _restore(self, saved: SavedSession) -> None:
+        """Replace the state of this new session with saved, and describe where the player is."""
+        game = self.game
+        locations = game.world.locations
+        self.log.remove_last_event()
+        self._snapshots = self._new_snapshots()
+        command = None
+        for loc_id, next_command, moves, bonus, inventory_size in saved.events:
+            self.log.add_event(Event(loc_id, locations[loc_id].long_description), command)
+            if moves is not None:
+                self._snapshots.append(Snapshot(loc_id, moves, bonus, inventory_size))
+            command = next_command
+        game.current_location_id = saved.location
+        game.state.visited = set(saved.visited)
+        for name in saved.inventory:
+            game.pickup_item(game.get_item(name))
+        self.moves_remaining = saved.moves
+        self.claimed_bonus = saved.bonus
+        self._out = []
+        self._picked = False
+        self._end_turn()
+        self._picked = True
+        self._opening = self._result(True)
+
+    def start(self) -> StepResult:
+        """Return what the player sees before entering their first command."""
+        return self._opening
+
+    def step(self, line: str) -> StepResult:
+        """Feed one line of input to the game and return what happened.
+
+        The line is a command at the current location, a menu option, or the answer to whatever the previous step
+        asked for (a puzzle answer, "hit"/"stand", or "y"/"n").
+        """
+        stats = self.stats
+        if stats is None:
+            return self._step(line)
+        start = perf_counter()
+        kind = self.command_type(line)
+        result = self._step(line)
+        stats.time(f"command.{kind if result.accepted else 'invalid'}", perf_counter() - start)
+        stats.count("steps")
+        stats.gauge("log.events", len(self.log))
+        return result
+
+    def command_type(self, line: str) -> str:
+        """Return the kind of command line is at this point of the game, as statistics are grouped: "answer" if it
+        answers a question, "go", "go to" or "pickup" for those commands, and the command itself otherwise."""
+        if self._pending is not None:
+            return "answer"
+        choice = line.lower().strip()
+        location = self.game.get_location()
+        if choice.startswith(GO_TO) and choice not in location.available_commands:
+            return "go to"
+        if choice not in location.available_commands and choice not in self._menu:
+            choice = self.game.world.commands.parser(location.id_num).resolve(choice) or choice
+        if choice.startswith("go "):
+            return "go"
+        if choice.startswith("pickup"):
+            return "pickup"
+        return choice
+
+    def _step(self, line: str) -> StepResult:
+        """Feed one line of input to the game and return what happened, without recording statistics."""
+        self._out = []
+        if not self.game.ongoing:
+            return self._result(False)
+        if self._pending is not None:
+            handler, self._pending = self._pending, None
+            self._picked = handler(self, line)
+            if self._pending is None:
+                self._end_turn()
+            return self._result(True)
+
+        choice = line.lower().strip()
+        location = self.game.get_location()
+        if choice.startswith(GO_TO) and choice not in location.available_commands:
+            return self._go_to(choice[len(GO_TO):])
+        if choice not in location.available_commands and choice not in self._menu:
+            parser = self.game.world.commands.parser(location.id_num)
+            resolved = parser.resolve(choice)
+            if resolved is None:
+                candidates = parser.candidates(choice) if choice and self.render else []
+                if len(candidates) > 1:
+                    self.say(f'"{choice}" could mean: {", ".join(candidates)}; try again.')
+                else:
+                    self.say("That was an invalid option; try again.")
+                return StepResult("".join(self._out), RETRY_PROMPT, False, True)
+            choice = resolved
+
+        if self.render:
+            self.say("========", f"You decided to: {choice}", "")
+        self._action = choice
+        self._picked = True
+        start = perf_counter() if self.stats is not None else 0.0
+        if choice in self._menu:
+            self._do_menu(choice)
+        else:
+            self._do_command(choice, location)
+        if start:
+            self.stats.time("phase.action", perf_counter() - start)
+        if self._pending is None and self.game.ongoing:
+            self._end_turn()
+        return self._result(True)
+
+    def complete(self, text: str) -> list[str]:
+        """Return the commands and menu options the player could mean by text at the current location, for
+        completing what they have typed so far. Nothing is completed while the engine waits for an answer."""
+        if self._pending is not None:
+            return []
+        return self.game.world.commands.parser(self.game.current_location_id).candidates(text)
+
+    @property
+    def waiting_for_answer(self) -> bool:
+        """Return whether the next line of input will be taken as an answer rather than a command."""
+        return self._pending is not None
+
+    def _result(self, accepted: bool) -> StepResult:
+        """Return the StepResult for the step in progress."""
+        if self._pending is not None:
+            prompt = self._pending_prompt
+        elif self.game.ongoing:
+            prompt = ACTION_PROMPT.format(self.moves_remaining)
+        else:
+            prompt = ""
+        return StepResult("".join(self._out), prompt, accepted, self.game.ongoing)
+
+    def say(self, *lines: str) -> None:
+        """Add the given lines to the output of the step in progress, as print would show them."""
+        if self.render:
+            for text in lines:
+                self._out.append(text)
+                self._out.append("\n")
+
+    def ask(self, handler: Callable[[GameEngine, str], bool], prompt: str) -> None:
+        """Make the next line of input go to handler, showing the player the given prompt. The handler is called
+        with this engine and the line, and returns whether the command it answers should be recorded as an event."""
+        self._pending = handler
+        self._pending_prompt = prompt
+
+    def _end_turn(self) -> None:
+        """Finish the turn of _action: record it, use up a move, and describe where the player now is."""
+        game = self.game
+        if self.moves_remaining == 0:
+            self.say("You lose :(")
+            game.ongoing = False
+            return
+        location = game.get_location()
+        stats = self.stats
+        start = perf_counter() if stats is not None else 0.0
+
+        if self._action not in self._menu and self._picked:
+            self.log.add_event(Event(location.id_num, location.long_description), self._action)
+            last = self.log.last
+            if last.prev and last.prev.id_num != last.id_num and self._costs_move:
+                self.moves_remaining -= 1
+            self._snapshots.append(Snapshot(location.id_num, self.moves_remaining, self.claimed_bonus,
+                                            len(game.inventory)))
+            if start:
+                now = perf_counter()
+                stats.time("phase.log", now - start)
+                stats.count("events.added")
+                start = now
+
+        visited = game.state.visited
+        seen = location.id_num in visited
+        if not seen:
+            visited.add(location.id_num)
+
+        if self.render:
+            self._out.append(game.world.views.view(location.id_num, seen, self._menu))
+        if start:
+            stats.time("phase.render", perf_counter() - start)
+
+    def describe(self) -> StepResult:
+        """Return what the player sees of where they are, with its long description, without taking a turn.
+
+        This is how a session that has not been rendering (such as one fast-forwarded by replay.fast_forward)
+        shows the player where it is once render is turned on.
+        """
+        self._out = []
+        game = self.game
+        if game.ongoing and self.render:
+            self._out.append(game.world.views.view(game.current_location_id, False, self._menu))
+        return self._result(True)
+
+    def _go_to(self, name: str) -> StepResult:
+        """Walk a shortest route to the location with the given name, one "go" command (and one move) at a time.
+
+        The walk is one command as far as statistics are concerned, so its steps are taken without recording them.
+        """
+        game = self.game
+        target = game.world.navigation.find(name)
+        if target == game.current_location_id:
+            here = game.get_location()
+            self.say(f"You are already at {here.name or f'location {here.id_num}'}.")
+            return self._result(True)
+        route = None if target is None else game.route(game.current_location_id, target)
+        if not route:
+            self.say(f"You don't know a way to {name.strip()} from here; try again.")
+            return StepResult("".join(self._out), RETRY_PROMPT, False, True)
+        outputs = []
+        result = None
+        for command in route:
+            result = self._step(command)
+            outputs.append(result.output)
+            if not result.ongoing:
+                break
+        return StepResult("".join(outputs), result.prompt, True, result.ongoing)
+
+    def _do_menu(self, choice: str) -> None:
+        """Carry out the menu option choice."""
+        game = self.game
+        if choice == "log":
+            if self.render:
+                for event in self.log:
+                    self.say(f"Location: {event.id_num}, Command: {event.next_command}")
+        elif choice == "look":
+            game.set_visited(False)
+        elif choice == "score":
+            self.say(f"- You currently have {game.score}/{WIN_SCORE} score")
+        elif choice == "quit":
+            if self.save_on_quit is not None:
+                self.save(self.save_on_quit)
+            game.ongoing = False
+        elif choice == "inventory":
+            if len(game.inventory) == 0:
+                self.say("- You have no item in your inventory")
+            if self.render:
+                for item in game.inventory:
+                    self.say(f"- {item.name}:\t\t{item.description}")
+        elif choice == "undo":
+            self._undo()
+        elif choice == STATS_COMMAND:
+            self.say(self.stats.report())
+
+    def _new_snapshots(self) -> deque[Snapshot]:
+        """Return an empty deque of snapshots holding no more than the events undo can reach in self.log: all of
+        them, or the in-memory tail of a JournalEventList."""
+        return deque(maxlen=self.log.tail_size if isinstance(self.log, JournalEventList) else None)
+
+    def _undo(self) -> None:
+        """Take back the last recorded event, restoring the session to its snapshot of the event before.
+
+        Nothing is undone if that event is out of reach: if there is no snapshot of it, or if the log no longer
+        holds it in memory (as a JournalEventList does not once it is older than its tail).
+        """
+        snapshots, log = self._snapshots, self.log
+        length = len(log)
+        if len(snapshots) < 2 or log.last is None or log.last.prev is None:
+            self.say("There is nothing to undo.")
+            return
+        log.remove_last_event()
+        if len(log) == length:
+            self.say("There is nothing to undo.")
+            return
+        snapshots.pop()
+        if self.stats is not None:
+            self.stats.count("events.removed")
+        snapshot = snapshots[-1]
+        self.game.current_location_id = snapshot.location_id
+        self.moves_remaining = snapshot.moves_remaining
+        self.claimed_bonus = snapshot.claimed_bonus
+        self.game.inventory.truncate(snapshot.inventory_size)
+
+    def _do_command(self, choice: str, location: Location) -> None:
+        """Carry out the location command choice at location, through its handler in the world's command table."""
+        game = self.game
+        command = game.world.commands.at(location.id_num)[choice]
+        game.current_location_id = location.available_commands[choice]
+        self._costs_move = command.costs_move
+        self._picked = command.run(self)
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
@@ -18,7 +18,14 @@ please consult our Course Syllabus.
 
 This file is Copyright (c) 2025 CSC111 Teaching Team
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterator, Mapping
+
+if TYPE_CHECKING:
+    from commands import CommandTable
+    from navigation import NavigationIndex
+    from views import ViewTable
 
 
 @dataclass
@@ -31,7 +38,9 @@ class Location:
         - long_description: a long description of the location.
         - available_commands: A mapping of commands (e.g., "go north") to descriptions or destinations.
         - items: a list of items present in this location.
-        - visited: a boolean indicating whether the player has previously visited this location.
+        - visited: a boolean indicating whether the player has previously visited this location. Locations in a
+          shared World are never marked visited; each session keeps its own visits in its SessionState.
+        - name: the name of the location (e.g. "Dorm Room"), or "" if it has none.
 
     Representation Invariants:
         -self.id_num > 0
@@ -45,6 +54,7 @@ class Location:
     available_commands: dict[str, int]
     items: list[str]
     visited: bool
+    name: str = ""
 
 
 @dataclass
@@ -86,6 +96,10 @@ class Puzzle:
         - lose: string for text shown when game is lost.
         - answer: a list representing the answer to the game.
         - dialogue: string representing a dialogue in the puzzle
+        - kind: the kind of puzzle, naming how it is played (one of commands.PUZZLE_KINDS)
+        - command: the command at loc that starts the puzzle
+        - requires: the name of the item the player needs to try the puzzle, or "" if none is needed
+        - done: text shown when the puzzle has already been solved
 
     Representation Invariants:
         - loc > 0
@@ -100,6 +114,151 @@ class Puzzle:
     lose: str
     answer: list
     dialogue: str
+    kind: str = ""
+    command: str = ""
+    requires: str = ""
+    done: str = ""
+
+
+@dataclass(frozen=True)
+class World:
+    """
+    The locations, items and puzzles of a game, loaded once and shared by every session played in it.
+
+    A World is never changed once built: its mappings are read-only and nothing that is specific to one player
+    (such as which locations they have visited) is stored in its entities.
+
+    Instance Attributes:
+        - locations: a mapping from location id to Location object.
+        - items: a mapping from item name to Item object.
+        - puzzles: a mapping from the location id a puzzle is at to its Puzzle object.
+        - navigation: the NavigationIndex of the "go" commands between the locations.
+        - commands: the CommandTable of the handlers of every location's commands.
+        - views: the ViewTable of the text shown on arriving at every location.
+
+    Representation Invariants:
+        - len(locations) > 0
+        - not any(location.visited for location in locations.values())
+    """
+
+    locations: Mapping[int, Location]
+    items: Mapping[str, Item]
+    puzzles: Mapping[int, Puzzle]
+    navigation: 'NavigationIndex' = field(init=False, repr=False, compare=False)
+    commands: 'CommandTable' = field(init=False, repr=False, compare=False)
+    views: 'ViewTable' = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Make the mappings of this world read-only and index its routes, commands and views."""
+        from commands import CommandTable  # these modules depend on this one, so they are imported late
+        from navigation import NavigationIndex
+        from views import ViewTable
+        for name in ('locations', 'items', 'puzzles'):
+            mapping = getattr(self, name)
+            if not isinstance(mapping, MappingProxyType):
+                object.__setattr__(self, name, MappingProxyType(dict(mapping)))
+        object.__setattr__(self, 'navigation', NavigationIndex(self.locations))
+        object.__setattr__(self, 'commands', CommandTable(self))
+        object.__setattr__(self, 'views', ViewTable(self.locations))
+
+
+class Inventory:
+    """
+    The items a player is carrying, in the order they were picked up.
+
+    Membership is checked by item name in constant time, and the total points of the items carried is kept up to
+    date as items are added and removed, so neither grows more expensive as the inventory does.
+
+    Instance Attributes:
+        - points: the sum of the target_points of the items in this inventory.
+
+    Representation Invariants:
+        - self.points == sum(item.target_points for item in self)
+    """
+    # Private Instance Attributes:
+    #   - _items: a mapping from item name to Item, in the order the items were added.
+
+    points: int
+    _items: dict[str, Item]
+
+    def __init__(self) -> None:
+        """Initialize a new empty inventory."""
+        self._items = {}
+        self.points = 0
+
+    def __contains__(self, item: object) -> bool:
+        """Return whether this inventory holds the given item (an Item or an item name)."""
+        name = item.name if isinstance(item, Item) else item
+        return name in self._items
+
+    def __iter__(self) -> Iterator[Item]:
+        """Iterate over the items in the order they were added."""
+        return iter(self._items.values())
+
+    def __len__(self) -> int:
+        """Return the number of items in this inventory."""
+        return len(self._items)
+
+    def add(self, item: Item) -> bool:
+        """Add item to this inventory and return True, or return False if an item of that name is already here."""
+        if item.name in self._items:
+            return False
+        self._items[item.name] = item
+        self.points += item.target_points
+        return True
+
+    def remove(self, item_name: str) -> Item:
+        """Remove and return the item with the given name.
+
+        Preconditions:
+        - item_name in self
+        """
+        item = self._items.pop(item_name)
+        self.points -= item.target_points
+        return item
+
+    def pop(self) -> Item:
+        """Remove and return the item that was added last.
+
+        Preconditions:
+        - len(self) > 0
+        """
+        item = self._items.popitem()[1]
+        self.points -= item.target_points
+        return item
+
+    def truncate(self, size: int) -> None:
+        """Remove the items added last until only the first size items remain.
+
+        Preconditions:
+        - 0 <= size
+        """
+        while len(self._items) > size:
+            self.pop()
+
+
+@dataclass
+class SessionState:
+    """
+    The state of one player's session in a World.
+
+    Instance Attributes:
+        - current_location_id: the id of the location the player is at.
+        - visited: the ids of the locations whose long description the player has already seen.
+        - inventory: the items the player has picked up, in the order they were picked up.
+
+    Representation Invariants:
+        - self.score >= 0
+    """
+
+    current_location_id: int
+    visited: set[int] = field(default_factory=set)
+    inventory: Inventory = field(default_factory=Inventory)
+
+    @property
+    def score(self) -> int:
+        """The score of the player: the points of every item in their inventory."""
+        return self.inventory.points
 
 
 if __name__ == "__main__":
@@ -0,0 +1,164 @@
+"""CSC111 Project 1: Text Adventure Game - Instrumentation
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module collects performance statistics of game sessions: latency histograms (with p50/p95/p99)
+per command type and per phase of a turn, call counters and event log sizes. A GameEngine only records
+statistics when it is given a Stats object, and otherwise pays nothing but a check for None.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import math
+
+BUCKETS_PER_DOUBLING = 8  # resolution of a histogram: each bucket is about 9% wider than the one before
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """A histogram of durations with logarithmic buckets, using constant memory however many are added.
+
+    Percentiles are reported as the upper bound of the bucket they fall in, so they overestimate by at most
+    one bucket width.
+
+    Instance Attributes:
+        - count: the number of durations added
+        - total: the sum of the durations added, in seconds
+        - maximum: the longest duration added, in seconds
+
+    >>> histogram = LatencyHistogram()
+    >>> for microseconds in range(1, 101):
+    ...     histogram.add(microseconds / 1e6)
+    >>> histogram.count, round(histogram.percentile(50) * 1e6), round(histogram.percentile(99) * 1e6)
+    (100, 51, 100)
+    """
+    # Private Instance Attributes:
+    #   - _buckets: a mapping from bucket number to the number of durations in it; bucket b holds durations of
+    #     up to 2 ** (b / BUCKETS_PER_DOUBLING) nanoseconds
+    count: int
+    total: float
+    maximum: float
+    _buckets: dict[int, int]
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self._buckets = {}
+
+    def add(self, seconds: float) -> None:
+        """Add a duration, in seconds, to this histogram."""
+        nanoseconds = seconds * 1e9
+        bucket = math.ceil(math.log2(nanoseconds) * BUCKETS_PER_DOUBLING) if nanoseconds > 1 else 0
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def percentile(self, p: float) -> float:
+        """Return the duration, in seconds, that p percent of the added durations do not exceed.
+
+        Preconditions:
+            - self.count > 0
+            - 0 <= p <= 100
+        """
+        rank = p / 100 * self.count
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(2 ** (bucket / BUCKETS_PER_DOUBLING) / 1e9, self.maximum)
+        return self.maximum
+
+    def summary(self) -> dict[str, float]:
+        """Return the count, mean, percentiles and maximum of this histogram (durations in seconds)."""
+        summary = {'count': self.count, 'mean': self.total / self.count if self.count else 0.0}
+        for p in PERCENTILES:
+            summary[f'p{p}'] = self.percentile(p) if self.count else 0.0
+        summary['max'] = self.maximum
+        return summary
+
+
+class Stats:
+    """Performance statistics collected from one or more game sessions.
+
+    Instance Attributes:
+        - latencies: a mapping from name (such as "command.go" or "phase.render") to its latency histogram
+        - counters: a mapping from name to the number of times it was counted
+        - gauges: a mapping from name to its last recorded value
+    """
+    latencies: dict[str, LatencyHistogram]
+    counters: dict[str, int]
+    gauges: dict[str, float]
+
+    def __init__(self) -> None:
+        self.latencies = {}
+        self.counters = {}
+        self.gauges = {}
+
+    def time(self, name: str, seconds: float) -> None:
+        """Record that the thing called name took the given number of seconds."""
+        histogram = self.latencies.get(name)
+        if histogram is None:
+            histogram = self.latencies[name] = LatencyHistogram()
+        histogram.add(seconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add amount to the counter called name."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def gauge(self, name: str, value: float) -> None:
+        """Record the current value of the gauge called name, and keep the largest value seen in name.max."""
+        self.gauges[name] = value
+        if value > self.gauges.get(name + '.max', value - 1):
+            self.gauges[name + '.max'] = value
+
+    def dump(self) -> dict:
+        """Return all statistics as a JSON-compatible dictionary (durations in seconds)."""
+        return {'latencies': {name: histogram.summary() for name, histogram in sorted(self.latencies.items())},
+                'counters': dict(sorted(self.counters.items())),
+                'gauges': dict(sorted(self.gauges.items()))}
+
+    def save(self, filename: str) -> None:
+        """Write dump() to the JSON file with the given filename."""
+        with open(filename, 'w') as f:
+            json.dump(self.dump(), f, indent=2)
+
+    def report(self) -> str:
+        """Return the statistics as a table for people to read (durations in microseconds)."""
+        lines = [f"{'latency (us)':<28}{'count':>8}" + ''.join(f"{f'p{p}':>10}" for p in PERCENTILES)
+                 + f"{'max':>10}"]
+        for name, histogram in sorted(self.latencies.items()):
+            summary = histogram.summary()
+            lines.append(f"{name:<28}{histogram.count:>8}"
+                         + ''.join(f"{summary[f'p{p}'] * 1e6:>10.1f}" for p in PERCENTILES)
+                         + f"{summary['max'] * 1e6:>10.1f}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<28}{value:>8}")
+        for name, value in sorted(self.gauges.items()):
+            lines.append(f"{name:<28}{value:>8g}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
@@ -0,0 +1,322 @@
+"""CSC111 Project 1: Text Adventure Game - Load Tester
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module measures how the game holds up with many players at once. It runs N simulated players
+concurrently; each plays recorded walkthroughs (by default win_walkthrough and lose_demo from
+walkthroughs.jsonl) one after another in fresh sessions, pausing a random think time before every line, until
+the run is over. Players reach their sessions through one of two transports:
+
+    - inprocess: every player drives its own GameEngine directly, measuring the game alone
+    - tcp: every player connects to a GameServer over localhost, measuring the game and the server together;
+      one server per start location of the walkthroughs runs in this process, unless --port names one that is
+      already running (with --turn-end), in which case every walkthrough must start where that server does
+
+    python loadtest.py --players 1000 --duration 30 --think 0.5 --transport tcp
+
+The report gives the throughput in turns per second, the latency percentiles of a turn (from sending a line
+to receiving the whole reply), the error rate, and the memory of one session.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Optional
+
+from adventure import load_world
+from batch_runner import Script, load_scripts
+from game_engine import GameEngine, RETRY_PROMPT
+from instrumentation import LatencyHistogram, PERCENTILES
+from server import GameServer, TURN_END
+
+TRANSPORTS = ('inprocess', 'tcp')
+DEFAULT_SCRIPTS = ('win_walkthrough', 'lose_demo')
+MEMORY_SAMPLE = 1000  # sessions created to measure the memory of one
+
+
+@dataclass
+class LoadReport:
+    """The results of a load test.
+
+    Instance Attributes:
+        - players: the number of simulated players
+        - transport: how players reached their sessions, one of TRANSPORTS
+        - elapsed: the length of the run, in seconds
+        - sessions: the number of sessions played to their end
+        - turns: the number of lines sent
+        - rejected: the number of lines the game did not accept, although the walkthrough expected it to
+        - errors: descriptions of the sessions that failed (lost connections, exceptions), at most one per kind
+        - error_count: the number of sessions that failed
+        - latency: the latency histogram of all turns
+        - session_bytes: the memory taken by one session, in bytes
+        - peak_rss: the peak resident memory of this process, in bytes
+
+    Representation Invariants:
+        - self.transport in TRANSPORTS
+        - self.rejected <= self.turns
+    """
+    players: int
+    transport: str
+    elapsed: float = 0.0
+    sessions: int = 0
+    turns: int = 0
+    rejected: int = 0
+    errors: list[str] = field(default_factory=list)
+    error_count: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    session_bytes: float = 0.0
+    peak_rss: int = 0
+
+    def error_rate(self) -> float:
+        """Return the fraction of sessions that failed."""
+        attempted = self.sessions + self.error_count
+        return self.error_count / attempted if attempted else 0.0
+
+    def fail(self, error: Exception) -> None:
+        """Record that a session failed with the given exception."""
+        self.error_count += 1
+        description = f"{type(error).__name__}: {error}"
+        if description not in self.errors:
+            self.errors.append(description)
+
+    def dump(self) -> dict:
+        """Return this report as a JSON-compatible dictionary (durations in seconds)."""
+        return {'players': self.players, 'transport': self.transport, 'elapsed': self.elapsed,
+                'sessions': self.sessions, 'turns': self.turns, 'turns_per_second': self.turns / self.elapsed,
+                'rejected': self.rejected, 'error_count': self.error_count, 'error_rate': self.error_rate(),
+                'errors': self.errors, 'latency': self.latency.summary(), 'session_bytes': self.session_bytes,
+                'peak_rss': self.peak_rss}
+
+    def summary(self) -> str:
+        """Return this report for people to read."""
+        latency = self.latency.summary() if self.latency.count else None
+        lines = [f"{self.players} players over {self.transport} for {self.elapsed:.1f}s",
+                 f"sessions: {self.sessions} finished, {self.error_count} failed ({self.error_rate():.2%})",
+                 f"turns: {self.turns} ({self.turns / self.elapsed:.0f}/s), {self.rejected} rejected"]
+        if latency is not None:
+            lines.append("turn latency: " + ", ".join(f"p{p} {latency[f'p{p}'] * 1e3:.2f}ms" for p in PERCENTILES)
+                         + f", max {latency['max'] * 1e3:.2f}ms")
+        lines.append(f"memory: {self.session_bytes / 1024:.1f} KiB per session, "
+                     f"peak RSS {self.peak_rss / 2 ** 20:.0f} MiB")
+        lines.extend(f"error: {error}" for error in self.errors)
+        return "\n".join(lines)
+
+
+class _InProcessSession:
+    """A session reached by calling its GameEngine directly."""
+    # Private Instance Attributes:
+    #   - _engine: the session's engine
+    _engine: GameEngine
+
+    def __init__(self, game_data_file: str, start: int) -> None:
+        self._engine = GameEngine(game_data_file, start)
+        self._engine.start()
+
+    async def send(self, line: str) -> tuple[bool, bool]:
+        """Play line and return whether it was accepted and whether the game is still running."""
+        result = self._engine.step(line)
+        return result.accepted, result.ongoing
+
+    async def close(self) -> None:
+        """End the session."""
+
+
+class _TcpSession:
+    """A session reached through a connection to a GameServer that ends every reply with TURN_END."""
+    # Private Instance Attributes:
+    #   - _reader, _writer: the two ends of the connection
+    _reader: asyncio.StreamReader
+    _writer: asyncio.StreamWriter
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> _TcpSession:
+        """Connect to the server at host and port and wait for its first prompt."""
+        session = cls(*await asyncio.open_connection(host, port))
+        await session._reader.readuntil(TURN_END.encode())
+        return session
+
+    async def send(self, line: str) -> tuple[bool, bool]:
+        """Play line and return whether it was accepted and whether the game is still running."""
+        self._writer.write(line.encode() + b"\n")
+        try:
+            reply = await self._reader.readuntil(TURN_END.encode())
+        except asyncio.IncompleteReadError:  # the server closed the session: the game is over
+            return True, False
+        return not reply.endswith((RETRY_PROMPT + TURN_END).encode()), True
+
+    async def close(self) -> None:
+        """End the session."""
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def _player(report: LoadReport, scripts: list[Script], game_data_file: str,
+                  addresses: Optional[dict[int, tuple[str, int]]], think: float, deadline: float,
+                  rng: random.Random) -> None:
+    """Play randomly chosen scripts, each in a new session, until deadline, pausing a random time (think on
+    average) before each line. Sessions are played in this process if addresses is None, and otherwise over a
+    connection to the address of the server for the script's start location."""
+    while time.perf_counter() < deadline:
+        script = rng.choice(scripts)
+        try:
+            if addresses is None:
+                session = _InProcessSession(game_data_file, script.start)
+            else:
+                session = await _TcpSession.connect(*addresses[script.start])
+            try:
+                for command in script.commands:
+                    await asyncio.sleep(rng.uniform(0, 2 * think))
+                    start = time.perf_counter()
+                    accepted, ongoing = await session.send(command)
+                    report.latency.add(time.perf_counter() - start)
+                    report.turns += 1
+                    report.rejected += not accepted
+                    if not ongoing:
+                        break
+            finally:
+                await session.close()
+        except (OSError, asyncio.IncompleteReadError, KeyError, AttributeError, IndexError, TypeError) as error:
+            report.fail(error)
+        else:
+            report.sessions += 1
+
+
+def session_memory(game_data_file: str, start: int, sample: int = MEMORY_SAMPLE) -> float:
+    """Return the memory, in bytes, that one new session of the game in game_data_file takes on top of the
+    shared world, averaged over sample sessions."""
+    load_world(game_data_file)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    engines = [GameEngine(game_data_file, start) for _ in range(sample)]
+    for engine in engines:
+        engine.start()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / len(engines)
+
+
+async def run_load(scripts: list[Script], game_data_file: str, players: int, duration: float, think: float,
+                   transport: str = 'inprocess', address: Optional[tuple[str, int]] = None,
+                   seed: Optional[int] = None) -> LoadReport:
+    """Run players simulated players over the given transport for duration seconds and return the report.
+
+    With the tcp transport, players connect to the server at address, or if address is None, to servers started
+    in this process on free localhost ports, one for each start location of scripts (a GameServer starts every
+    session at the same location).
+
+    Raise ValueError if address is given but the scripts do not all start at the same location.
+
+    Preconditions:
+        - scripts != []
+        - transport in TRANSPORTS
+    """
+    starts = sorted({script.start for script in scripts})
+    if transport == 'tcp' and address is not None and len(starts) > 1:
+        raise ValueError(f"the server at {address[0]}:{address[1]} starts every session at one location, but the "
+                         f"walkthroughs start at {', '.join(map(str, starts))}")
+    report = LoadReport(players, transport)
+    report.session_bytes = session_memory(game_data_file, starts[0])
+    servers, listeners = [], []
+    addresses = None
+    if transport == 'tcp' and address is not None:
+        addresses = {starts[0]: address}
+    elif transport == 'tcp':
+        addresses = {}
+        for start_id in starts:
+            server = GameServer(game_data_file, start_id, turn_end=TURN_END)
+            listener = await server.listen('127.0.0.1', 0)
+            servers.append(server)
+            listeners.append(listener)
+            addresses[start_id] = ('127.0.0.1', listener.sockets[0].getsockname()[1])
+
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(_player(report, scripts, game_data_file, addresses, think, deadline,
+                                   random.Random(rng.random())) for _ in range(players)))
+    report.elapsed = time.perf_counter() - start
+    for listener in listeners:
+        listener.close()
+        await listener.wait_closed()
+    while any(server.sessions for server in servers):  # let the servers finish closing the last sessions
+        await asyncio.sleep(0.01)
+    report.peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return report
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the load tester command line and return its exit status (1 if any session failed)."""
+    parser = argparse.ArgumentParser(description="Measure the game under many concurrent simulated players.")
+    parser.add_argument('--players', type=int, default=100, help="concurrent players (default: 100)")
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds to run for (default: 10)")
+    parser.add_argument('--think', type=float, default=0.2,
+                        help="average seconds a player waits before each line (default: 0.2)")
+    parser.add_argument('--transport', choices=TRANSPORTS, default='inprocess', help="how players reach the game")
+    parser.add_argument('--port', type=int, help="port of a running server started with --turn-end (tcp only)")
+    parser.add_argument('--host', default='127.0.0.1', help="host of the running server (default: 127.0.0.1)")
+    parser.add_argument('--data', default='game_data.json', help="game data file (default: game_data.json)")
+    parser.add_argument('--scripts', default='walkthroughs.jsonl', help="walkthroughs (default: walkthroughs.jsonl)")
+    parser.add_argument('--names', nargs='*', default=list(DEFAULT_SCRIPTS),
+                        help=f"walkthroughs to play (default: {' '.join(DEFAULT_SCRIPTS)})")
+    parser.add_argument('--seed', type=int, help="random seed for think times and script choices")
+    parser.add_argument('--json', metavar='FILE', help="also write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    scripts = [script for script in load_scripts(args.scripts) if script.name in args.names]
+    if not scripts:
+        print(f"no walkthroughs named {' '.join(args.names)} in {args.scripts}")
+        return 2
+    limit = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if args.transport == 'tcp' and limit[0] < 2 * args.players + 64:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(limit[1], 2 * args.players + 64), limit[1]))
+    address = (args.host, args.port) if args.port is not None else None
+
+    try:
+        report = asyncio.run(run_load(scripts, args.data, args.players, args.duration, args.think, args.transport,
+                                      address, args.seed))
+    except ValueError as error:
+        print(error)
+        return 2
+    print(report.summary())
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report.dump(), f, indent=2)
+    return 1 if report.error_count else 0
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""CSC111 Project 1: Text Adventure Game - Navigation Index
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the navigation index of a game world: shortest distances and next-hop commands
+between every pair of locations over the "go ..." commands, so routes can be looked up instead of searched for.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from collections import deque
+from typing import Mapping, Optional
+
+from game_entities import Location
+
+MOVE_PREFIX = "go "
+PRECOMPUTE_LIMIT = 500  # worlds with at most this many locations get every table built up front
+
+
+class NavigationIndex:
+    """All-pairs shortest distances and next-hop commands over the "go ..." commands of a world.
+
+    The tables are kept per target location: for a target b, the table maps every location a that can reach b to
+    (the number of moves from a to b, the command to take at a to get one move closer to b). A table is built by a
+    single breadth-first search backwards from b, either all up front by precompute or the first time b is asked
+    about, so route(a, b) only ever walks the path itself. Nothing is indexed until the first question is asked, so
+    an index costs nothing in worlds where routes are never needed.
+
+    >>> locations = {1: Location(1, 'a', 'a', {'go east': 2}, [], False, 'Hall'),
+    ...              2: Location(2, 'b', 'b', {'go west': 1, 'go east': 3}, [], False, 'Kitchen'),
+    ...              3: Location(3, 'c', 'c', {'go west': 2}, [], False, 'Garden')}
+    >>> nav = NavigationIndex(locations)
+    >>> nav.distance(1, 3), nav.route(1, 3), nav.route(3, 3)
+    (2, ['go east', 'go east'], [])
+    >>> nav.find('garden'), nav.distance(1, 4)
+    (3, None)
+    """
+    # Private Instance Attributes:
+    #   - _locations: the locations of the world
+    #   - _incoming: a mapping from location id to the (source id, command) of every "go" command leading there,
+    #     or None if it has not been built yet
+    #   - _tables: a mapping from target location id to its table of (distance, next command) by source id
+    #   - _names: a mapping from lower-cased location name to location id, or None if it has not been built yet
+    _locations: Mapping[int, Location]
+    _incoming: Optional[dict[int, list[tuple[int, str]]]]
+    _tables: dict[int, dict[int, tuple[int, str]]]
+    _names: Optional[dict[str, int]]
+
+    def __init__(self, locations: Mapping[int, Location]) -> None:
+        """Initialize the navigation index of the given locations. No tables are built yet."""
+        self._locations = locations
+        self._incoming = None
+        self._tables = {}
+        self._names = None
+
+    def _edges(self) -> dict[int, list[tuple[int, str]]]:
+        """Return the "go" commands leading to each location, collecting them if that has not been done yet."""
+        if self._incoming is None:
+            incoming = {loc_id: [] for loc_id in self._locations}
+            for location in self._locations.values():
+                for command, target in location.available_commands.items():
+                    if command.startswith(MOVE_PREFIX) and target != location.id_num and target in incoming:
+                        incoming[target].append((location.id_num, command))
+            self._incoming = incoming
+        return self._incoming
+
+    def precompute(self) -> None:
+        """Build the table of every location."""
+        for loc_id in self._locations:
+            self._table(loc_id)
+
+    def _table(self, target: int) -> dict[int, tuple[int, str]]:
+        """Return the table of (distance, next command) to target, building it if it has not been built yet."""
+        table = self._tables.get(target)
+        if table is None:
+            incoming = self._edges()
+            table = {target: (0, '')}
+            queue = deque([target])
+            while queue:
+                loc_id = queue.popleft()
+                distance = table[loc_id][0] + 1
+                for source, command in incoming[loc_id]:
+                    if source not in table:
+                        table[source] = (distance, command)
+                        queue.append(source)
+            self._tables[target] = table
+        return table
+
+    def distance(self, a: int, b: int) -> Optional[int]:
+        """Return the fewest "go" commands needed to get from location a to location b, or None if b cannot be
+        reached from a."""
+        if b not in self._locations:
+            return None
+        entry = self._table(b).get(a)
+        return None if entry is None else entry[0]
+
+    def route(self, a: int, b: int) -> Optional[list[str]]:
+        """Return the commands of a shortest route from location a to location b, or None if b cannot be reached
+        from a."""
+        if b not in self._locations:
+            return None
+        table = self._table(b)
+        if a not in table:
+            return None
+        commands = []
+        loc_id = a
+        while loc_id != b:
+            command = table[loc_id][1]
+            commands.append(command)
+            loc_id = self._locations[loc_id].available_commands[command]
+        return commands
+
+    def find(self, name: str) -> Optional[int]:
+        """Return the id of the location with the given name (ignoring case), or None if there is none."""
+        if self._names is None:
+            self._names = {}
+            for location in self._locations.values():
+                if location.name:
+                    self._names.setdefault(location.name.lower(), location.id_num)
+        return self._names.get(name.strip().lower())
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
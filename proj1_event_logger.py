@@ -22,8 +22,11 @@ This file is Copyright (c) 2025 CSC111 Teaching Team
 """
 
 from __future__ import annotations
+import json
+from array import array
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional
+from typing import IO, Iterator, Optional, overload
 
 
 @dataclass
@@ -57,14 +60,23 @@ class EventList:
     Representation Invariants:
         - type(first) == type(last)
     """
+    # Private Instance Attributes:
+    #   - _length: the number of events in this list
     first: Optional[Event]
     last: Optional[Event]
+    _length: int
 
     def __init__(self) -> None:
         """Initialize a new empty event list."""
 
         self.first = None
         self.last = None
+        self._length = 0
+
+    def __len__(self) -> int:
+        """Return the number of events in this list."""
+
+        return self._length
 
     def display_events(self) -> None:
         """Display all events in chronological order."""
@@ -73,6 +85,13 @@ class EventList:
             print(f"Location: {curr.id_num}, Command: {curr.next_command}")
             curr = curr.next
 
+    def __iter__(self) -> Iterator[Event]:
+        """Iterate over the events in chronological order."""
+        curr = self.first
+        while curr:
+            yield curr
+            curr = curr.next
+
     def is_empty(self) -> bool:
         """Return whether this event list is empty."""
 
@@ -92,12 +111,14 @@ class EventList:
             self.last.next_command = command
             self.last.next = new
         self.last = new
+        self._length += 1
 
     def remove_last_event(self) -> None:
         """Remove the last event from this event list.
         If the list is empty, do nothing."""
 
         if not self.is_empty():
+            self._length -= 1
             if self.last == self.first:
                 self.last = None
                 self.first = None
@@ -119,6 +140,377 @@ class EventList:
     # Note: You may add other methods to this class as needed
 
 
+class LoggedEvent:
+    """
+    One event of an ArrayEventList, materialized when it is looked at.
+
+    A LoggedEvent reads everything from its list, so it offers the same attributes as Event (including next and
+    prev) without the list having to store a node per event. It reflects the list as it is when an attribute is
+    read, and should not be kept after events are removed from the list.
+
+    Instance Attributes:
+    - index: the position of this event in its list
+    """
+    __slots__ = ('_log', 'index')
+    _log: ArrayEventList
+    index: int
+
+    def __init__(self, log: ArrayEventList, index: int) -> None:
+        """Initialize the view of the event at the given index of log."""
+        self._log = log
+        self.index = index
+
+    @property
+    def id_num(self) -> int:
+        """Integer id of this event's location"""
+        return self._log.ids[self.index]
+
+    @property
+    def description(self) -> str:
+        """Long description of this event's location"""
+        return self._log.descriptions.get(self.id_num, '')
+
+    @property
+    def next_command(self) -> Optional[str]:
+        """The command which leads this event to the next event, None if this is the last game event"""
+        return self._log.command_at(self.index + 1)
+
+    @property
+    def next(self) -> Optional[LoggedEvent]:
+        """The next event in the game, or None if this is the last game event"""
+        return LoggedEvent(self._log, self.index + 1) if self.index + 1 < len(self._log) else None
+
+    @property
+    def prev(self) -> Optional[LoggedEvent]:
+        """The previous event in the game, None if this is the first game event"""
+        return LoggedEvent(self._log, self.index - 1) if self.index > 0 else None
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether other is the same event of the same list."""
+        return isinstance(other, LoggedEvent) and other._log is self._log and other.index == self.index
+
+    def __repr__(self) -> str:
+        """Return a representation of this event like that of Event."""
+        return f"LoggedEvent(id_num={self.id_num}, next_command={self.next_command!r})"
+
+
+class ArrayEventList:
+    """
+    An array-backed list of game events, with the same interface as EventList.
+
+    Events are stored as two parallel compact arrays: the location id of every event and the (interned) id of the
+    command used to reach it. Descriptions are kept once per location rather than once per event. Events are
+    materialized as LoggedEvent objects only when they are looked at, so the list also supports len, indexing and
+    slicing in constant time per event, and its id log is the ids array itself.
+
+    Instance Attributes:
+        - ids: the location id of each event, in order
+        - descriptions: a mapping from location id to the description of that location
+
+    Representation Invariants:
+        - len(self.ids) == len(self._commands)
+        - all(i in self.descriptions for i in self.ids)
+
+    >>> log = ArrayEventList()
+    >>> log.add_event(Event(7, "Dorm Room"))
+    >>> log.add_event(Event(13, "South Hallway"), "go south")
+    >>> log.add_event(Event(7, "Dorm Room"), "go north")
+    >>> len(log), log.get_id_log(), log[-2].next_command, log[0].description
+    (3, [7, 13, 7], 'go north', 'Dorm Room')
+    >>> [event.id_num for event in log[1:]]
+    [13, 7]
+    >>> log.remove_last_event()
+    >>> log.last.id_num, log.last.next_command
+    (13, None)
+    """
+    # Private Instance Attributes:
+    #   - _commands: for each event, the id of the command used to reach it, or -1 for the first event
+    #   - _command_names: the command with each command id
+    #   - _command_ids: a mapping from command to its command id
+    ids: array
+    descriptions: dict[int, str]
+    _commands: array
+    _command_names: list[str]
+    _command_ids: dict[str, int]
+
+    def __init__(self) -> None:
+        """Initialize a new empty event list."""
+        self.ids = array('i')
+        self.descriptions = {}
+        self._commands = array('i')
+        self._command_names = []
+        self._command_ids = {}
+
+    def __len__(self) -> int:
+        """Return the number of events in this list."""
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> LoggedEvent: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[LoggedEvent]: ...
+
+    def __getitem__(self, index: int | slice) -> LoggedEvent | list[LoggedEvent]:
+        """Return the event at the given index, or a list of the events in the given slice."""
+        if isinstance(index, slice):
+            return [LoggedEvent(self, i) for i in range(*index.indices(len(self.ids)))]
+        if index < 0:
+            index += len(self.ids)
+        if not 0 <= index < len(self.ids):
+            raise IndexError('event index out of range')
+        return LoggedEvent(self, index)
+
+    def __iter__(self) -> Iterator[LoggedEvent]:
+        """Iterate over the events in chronological order."""
+        return (LoggedEvent(self, i) for i in range(len(self.ids)))
+
+    @property
+    def first(self) -> Optional[LoggedEvent]:
+        """The first event to happen, or None if this list is empty."""
+        return LoggedEvent(self, 0) if self.ids else None
+
+    @property
+    def last(self) -> Optional[LoggedEvent]:
+        """The last event to happen, or None if this list is empty."""
+        return LoggedEvent(self, len(self.ids) - 1) if self.ids else None
+
+    def command_at(self, index: int) -> Optional[str]:
+        """Return the command used to reach the event at the given index, or None if there is no such command."""
+        if 0 < index < len(self._commands) and self._commands[index] >= 0:
+            return self._command_names[self._commands[index]]
+        return None
+
+    def display_events(self) -> None:
+        """Display all events in chronological order."""
+        for i in range(len(self.ids)):
+            print(f"Location: {self.ids[i]}, Command: {self.command_at(i + 1)}")
+
+    def is_empty(self) -> bool:
+        """Return whether this event list is empty."""
+        return not self.ids
+
+    def add_event(self, event: Event, command: str = None) -> None:
+        """Add the given new event to the end of this event list.
+        The given command is the command which was used to reach this new event, or None if this is the first
+        event in the game.
+
+        Only the location id and description of event are kept; event itself is not linked into this list.
+        """
+        if command is None or not self.ids:
+            command_id = -1
+        else:
+            command_id = self._command_ids.get(command)
+            if command_id is None:
+                command_id = len(self._command_names)
+                self._command_ids[command] = command_id
+                self._command_names.append(command)
+        self.ids.append(event.id_num)
+        self._commands.append(command_id)
+        if event.id_num not in self.descriptions:
+            self.descriptions[event.id_num] = event.description
+
+    def remove_last_event(self) -> None:
+        """Remove the last event from this event list.
+        If the list is empty, do nothing."""
+        if self.ids:
+            self.ids.pop()
+            self._commands.pop()
+
+    def get_id_log(self) -> list[int]:
+        """Return a list of all location IDs visited for each event in this list, in sequence."""
+        return self.ids.tolist()
+
+
+JOURNAL_VERSION = 1
+DEFAULT_TAIL_SIZE = 64
+DEFAULT_FLUSH_EVERY = 256
+_UNDO_RECORD = '[]\n'
+
+
+class JournalEventList:
+    """
+    An append-only event list that streams its events to a file on disk.
+
+    Only the last tail_size events are kept in memory (as an EventList), which is as far back as undo can reach;
+    everything else lives only in the journal file. Records are written in batches of flush_every.
+
+    The journal is a JSON lines file. Its first line is a header {"journal": version, "tail": tail_size}; every
+    other line is either [location id, command] for an added event (command is null for the first event) or []
+    for the removal of the last event. Use read_journal or iterate over the list to read the events back lazily.
+
+    Instance Attributes:
+        - filename: the name of the journal file
+        - tail_size: the number of most recent events kept in memory
+        - flush_every: the number of records buffered before they are written to the file
+        - descriptions: a mapping from location id to the description of that location
+
+    Representation Invariants:
+        - 0 < self.tail_size
+        - 0 < self.flush_every
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'session.jsonl')
+    >>> with JournalEventList(path, tail_size=2) as log:
+    ...     log.add_event(Event(7, "Dorm Room"))
+    ...     log.add_event(Event(13, "South Hallway"), "go south")
+    ...     log.add_event(Event(19, "Reception"), "go south")
+    ...     log.remove_last_event()
+    ...     log.add_event(Event(7, "Dorm Room"), "go north")
+    ...     (len(log), log.last.prev.id_num, log.last.prev.prev)
+    (3, 13, None)
+    >>> list(read_journal(path))
+    [(7, None), (13, 'go south'), (7, 'go north')]
+    """
+    # Private Instance Attributes:
+    #   - _tail: the last (at most tail_size) events of the list
+    #   - _tail_length: the number of events in _tail
+    #   - _length: the number of events in the whole list
+    #   - _buffer: the records not yet written to the file
+    #   - _file: the open journal file
+    filename: str
+    tail_size: int
+    flush_every: int
+    descriptions: dict[int, str]
+    _tail: EventList
+    _tail_length: int
+    _length: int
+    _buffer: list[str]
+    _file: IO[str]
+
+    def __init__(self, filename: str, tail_size: int = DEFAULT_TAIL_SIZE,
+                 flush_every: int = DEFAULT_FLUSH_EVERY) -> None:
+        """Initialize a new empty event list journaled to the given file, replacing anything in the file."""
+        self.filename = filename
+        self.tail_size = tail_size
+        self.flush_every = flush_every
+        self.descriptions = {}
+        self._tail = EventList()
+        self._tail_length = 0
+        self._length = 0
+        self._buffer = []
+        self._file = open(filename, 'w', encoding='utf-8')
+        self._file.write(json.dumps({'journal': JOURNAL_VERSION, 'tail': tail_size}) + '\n')
+
+    def __enter__(self) -> JournalEventList:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of events in this list."""
+        return self._length
+
+    def __iter__(self) -> Iterator[Event]:
+        """Lazily iterate over all events in chronological order, reading them back from the journal.
+
+        The events are new, unlinked Event objects (next and prev are None).
+        """
+        self.flush()
+        previous = None
+        for id_num, command in read_journal(self.filename):
+            if previous is not None:
+                previous.next_command = command
+                yield previous
+            previous = Event(id_num, self.descriptions.get(id_num, ''))
+        if previous is not None:
+            yield previous
+
+    @property
+    def first(self) -> Optional[Event]:
+        """The first event to happen (read back from the journal), or None if this list is empty."""
+        return next(iter(self), None) if self._length else None
+
+    @property
+    def last(self) -> Optional[Event]:
+        """The last event to happen, or None if this list is empty. Its prev links reach back through the tail."""
+        return self._tail.last
+
+    def flush(self) -> None:
+        """Write all buffered records to the journal file."""
+        if self._buffer:
+            self._file.write(''.join(self._buffer))
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the journal file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def display_events(self) -> None:
+        """Display all events in chronological order."""
+        for event in self:
+            print(f"Location: {event.id_num}, Command: {event.next_command}")
+
+    def is_empty(self) -> bool:
+        """Return whether this event list is empty."""
+        return self._length == 0
+
+    def add_event(self, event: Event, command: str = None) -> None:
+        """Add the given new event to the end of this event list.
+        The given command is the command which was used to reach this new event, or None if this is the first
+        event in the game.
+        """
+        if self._length == 0:
+            command = None
+        self._tail.add_event(event, command)
+        if self._tail_length == self.tail_size:
+            self._tail.first = self._tail.first.next
+            self._tail.first.prev = None
+        else:
+            self._tail_length += 1
+        self._length += 1
+        if event.id_num not in self.descriptions:
+            self.descriptions[event.id_num] = event.description
+        self._buffer.append(json.dumps([event.id_num, command]) + '\n')
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def remove_last_event(self) -> None:
+        """Remove the last event from this event list.
+        If the list is empty, or the last event has already left the in-memory tail, do nothing."""
+        if self._tail_length == 0:
+            return
+        self._tail.remove_last_event()
+        self._tail_length -= 1
+        self._length -= 1
+        if self._buffer and self._buffer[-1] != _UNDO_RECORD:
+            self._buffer.pop()
+        else:
+            self._buffer.append(_UNDO_RECORD)
+
+    def get_id_log(self) -> list[int]:
+        """Return a list of all location IDs visited for each event in this list, in sequence."""
+        self.flush()
+        return [id_num for id_num, _ in read_journal(self.filename)]
+
+
+def read_journal(filename: str) -> Iterator[tuple[int, Optional[str]]]:
+    """Lazily yield (location id, command used to reach it) for every event in the journal with the given filename.
+
+    Removed events are not yielded. Only as many events as the journal's tail size are held in memory at once,
+    since no older event can be removed.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if header.get('journal') != JOURNAL_VERSION:
+            raise ValueError(f"{filename} is not a version {JOURNAL_VERSION} event journal")
+        tail_size = header['tail']
+        pending = deque()
+        for line in f:
+            record = json.loads(line)
+            if record:
+                pending.append((record[0], record[1]))
+                if len(pending) > tail_size:
+                    yield pending.popleft()
+            elif pending:
+                pending.pop()
+        yield from pending
+
+
 if __name__ == "__main__":
     pass
     # When you are ready to check your work with python_ta, uncomment the following lines.
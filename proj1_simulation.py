@@ -21,9 +21,12 @@ please consult our Course Syllabus.
 This file is Copyright (c) 2025 CSC111 Teaching Team
 """
 from __future__ import annotations
+from typing import Optional
 from proj1_event_logger import Event, EventList
 from adventure import AdventureGame
-from game_entities import Location
+from game_entities import Location, World
+from commands import Blackjack, Bonus, Door, PuzzleCommand, Reward
+from game_engine import MENU
 
 
 class AdventureGameSimulation:
@@ -35,15 +38,17 @@ class AdventureGameSimulation:
     _game: AdventureGame
     _events: EventList
 
-    def __init__(self, game_data_file: str, initial_location_id: int, commands: list[str | bool]) -> None:
+    def __init__(self, game_data_file: str, initial_location_id: int, commands: list[str | bool],
+                 world: Optional[World] = None) -> None:
         """Initialize a new game simulation based on the given game data, that runs through the given commands.
+        If world is given, the simulation is played in it instead of the World loaded from game_data_file.
 
         Preconditions:
         - len(commands) > 0
         - all commands in the given list are valid commands at each associated location in the game
         """
         self._events = EventList()
-        self._game = AdventureGame(game_data_file, initial_location_id)
+        self._game = AdventureGame(game_data_file, initial_location_id, world)
         loc = self._game.get_location()
         e = Event(loc.id_num, loc.long_description)
         self._events.add_event(e)
@@ -57,20 +62,38 @@ class AdventureGameSimulation:
         - all commands in the given list are valid commands at each associated location in the game
         """
 
+        commands_at = self._game.world.commands.at
+        pending = None  # the puzzle command whose answers the next commands are, if any
         for command in commands:
-            if command in ("look", "inventory", "score", "undo", "log", "quit", "hit", "stand",
-                           "4169784500", "62759709"):       # password or commands that doesn't change location
+            if pending is None and command in MENU:
+                continue
+            if pending is None:
+                handler = commands_at(current_location.id_num)[command]
+                if isinstance(handler, (Reward, Door, Blackjack)):
+                    pending = handler
+                if isinstance(handler, Bonus):
+                    loc = self._teleport(handler)
+                else:
+                    loc = self._game.get_location(current_location.available_commands[command])
+            elif isinstance(pending, Blackjack) and command in ("hit", "stand"):
+                continue    # answers that don't change location
+            elif isinstance(pending, Reward):
+                pending = None
                 continue
-            if command in ("goose alone fox goose beans alone goose", "3843", "get 10 extra moves", "y", "n"):
-                puzzle = self._game.get_puzzle(current_location.id_num)
-                loc = self._game.get_location(puzzle.next_loc)
-                self._events.remove_last_event()    # we don't want to add the location twice
             else:
-                loc = self._game.get_location(current_location.available_commands[command])
+                loc = self._teleport(pending)
+                if not (isinstance(pending, Blackjack) and command == "y"):     # "y" plays another hand
+                    pending = None
             e = Event(loc.id_num, loc.long_description)
             self._events.add_event(e, command)
             current_location = loc
 
+    def _teleport(self, handler: PuzzleCommand) -> Location:
+        """Take back the last event, whose location is passed through by the puzzle of handler, and return the
+        puzzle's next location."""
+        self._events.remove_last_event()    # we don't want to add the location twice
+        return self._game.get_location(handler.puzzle.next_loc)
+
     def get_id_log(self) -> list[int]:
         """
         Get back a list of all location IDs in the order that they are visited within a game simulation
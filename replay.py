@@ -0,0 +1,172 @@
+"""CSC111 Project 1: Text Adventure Game - Deterministic Replay
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module records game sessions and plays them back against the real rules. Unlike an event log, which
+only keeps the commands that were recorded as events, a recording keeps every line the player entered (puzzle
+answers, "hit"/"stand", undos and invalid commands included) along with the seed of the session's random number
+generator, so playing it back reaches exactly the same state: location, inventory, score, moves and event log.
+
+A recording file is one line of compact JSON:
+
+    {"recording": 1, "world": "<sha256 of the game data file>", "start": 7, "seed": 1234,
+     "inputs": ["pickup cellphone", "go south", "call reception", "4169784500", ...]}
+
+Playback fast-forwards: the session does not render any text, so even a very long recording is played back in a
+fraction of a second. Rendering can be turned on at any step to carry on from there as usual:
+
+    python adventure.py --record my.rec              # play, recording every line you enter
+    python replay.py my.rec                          # fast-forward to the end and show the final state
+    python replay.py my.rec --from 40                # fast-forward 40 steps, then show the rest being played
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from game_engine import GameEngine
+from instrumentation import Stats
+from proj1_event_logger import EventList, ArrayEventList, JournalEventList
+from savegame import world_hash
+
+REPLAY_VERSION = 1
+SEED_BITS = 32
+
+
+@dataclass
+class Recording:
+    """Every line of input of a session, and what is needed to play them back.
+
+    Instance Attributes:
+        - world: the SHA-256 hash (in hex) of the game data file the session was played in
+        - start: the location id the session started from
+        - seed: the seed of the session's random number generator
+        - inputs: every line the player entered, in order
+    """
+    world: str
+    start: int
+    seed: int
+    inputs: list[str]
+
+
+def new_recording(game_data_file: str, start: int, seed: Optional[int] = None) -> Recording:
+    """Return an empty recording of a session in the given game data file from the given start, with the given
+    seed (or a random one if seed is None)."""
+    if seed is None:
+        seed = random.getrandbits(SEED_BITS)
+    return Recording(world_hash(game_data_file), start, seed, [])
+
+
+def recorded_engine(recording: Recording, game_data_file: str, render: bool = True,
+                    log: Optional[EventList | ArrayEventList | JournalEventList] = None,
+                    stats: Optional[Stats] = None) -> GameEngine:
+    """Return a new session of recording, which is yet to take any of its inputs, recording its performance
+    statistics in stats if it is given.
+
+    Raise ValueError if recording was made in a different game data file.
+    """
+    if recording.world != world_hash(game_data_file):
+        raise ValueError(f"the recording was made in a different world than {game_data_file}")
+    return GameEngine(game_data_file, recording.start, render, log, stats, random.Random(recording.seed))
+
+
+def fast_forward(recording: Recording, game_data_file: str, steps: Optional[int] = None,
+                 log: Optional[EventList | ArrayEventList | JournalEventList] = None) -> GameEngine:
+    """Return a session of recording that has taken its first steps inputs (all of them if steps is None), played
+    without rendering. Turn on its render attribute to carry on with rendered output, and call its describe method
+    to show the player where they are.
+
+    Raise ValueError if recording was made in a different game data file.
+    """
+    engine = recorded_engine(recording, game_data_file, False, log)
+    step = engine.step
+    for line in recording.inputs[:steps]:
+        step(line)
+    return engine
+
+
+def write_recording(recording: Recording, filename: str) -> None:
+    """Write recording to the file with the given filename, replacing it only once it is completely written."""
+    record = {'recording': REPLAY_VERSION, 'world': recording.world, 'start': recording.start,
+              'seed': recording.seed, 'inputs': recording.inputs}
+    temporary = filename + '.tmp'
+    with open(temporary, 'w', encoding='utf-8') as f:
+        json.dump(record, f, separators=(',', ':'))
+        f.write('\n')
+    os.replace(temporary, filename)
+
+
+def read_recording(filename: str) -> Recording:
+    """Return the recording in the file with the given filename.
+
+    Raise ValueError if the file is not a recording of this version.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        try:
+            record = json.load(f)
+        except json.JSONDecodeError:
+            record = None
+    if not isinstance(record, dict) or record.get('recording') != REPLAY_VERSION:
+        raise ValueError(f"{filename} is not a version {REPLAY_VERSION} recording")
+    return Recording(record['world'], record['start'], record['seed'], record['inputs'])
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the replay command line and return its exit status."""
+    parser = argparse.ArgumentParser(description="Play back a recorded game session.")
+    parser.add_argument('recording', help="recording file, made with: python adventure.py --record FILE")
+    parser.add_argument('--data', default='game_data.json', help="game data file (default: game_data.json)")
+    parser.add_argument('--from', dest='start_step', type=int, default=None, metavar='STEP',
+                        help="fast-forward this many steps, then show the rest of the session being played")
+    args = parser.parse_args(argv)
+
+    recording = read_recording(args.recording)
+    began = time.perf_counter()
+    engine = fast_forward(recording, args.data, args.start_step)
+    elapsed = time.perf_counter() - began
+    steps = len(recording.inputs) if args.start_step is None else min(args.start_step, len(recording.inputs))
+    print(f"fast-forwarded {steps} steps in {elapsed * 1000:.1f}ms")
+
+    engine.render = True
+    result = engine.describe()
+    print(result.output, end="")
+    if args.start_step is not None:
+        for line in recording.inputs[args.start_step:]:
+            print(result.prompt + line)
+            result = engine.step(line)
+            print(result.output, end="")
+    game = engine.game
+    print(f"\nfinal state: location {game.current_location_id}, score {game.score}, "
+          f"{engine.moves_remaining} moves remaining, {len(engine.log)} events, "
+          f"{'ongoing' if game.ongoing else 'over'}")
+    return 0
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    sys.exit(main())
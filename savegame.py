@@ -0,0 +1,128 @@
+"""CSC111 Project 1: Text Adventure Game - Saved Sessions
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the file format of saved game sessions. A save file holds everything a session
+needs to carry on exactly where it stopped (current location, visited locations, inventory, moves remaining,
+claimed bonus, and every event with the state undo restores to) but no text from the world: events and items
+are stored by location id and item name, and the world is identified by the SHA-256 hash of its game data
+file. Loading a save therefore takes time in proportion to the session, not to the world.
+
+A save file is one line of compact JSON:
+
+    {"save": 1, "world": "<sha256 of the game data file>", "location": 19, "visited": [7, 13, 19],
+     "inventory": ["cellphone"], "moves": 23, "bonus": false,
+     "events": [[7, "pickup cellphone", 25, false, 1], [7, "go south", 25, false, 1], [13, "go south", 24, ...], ...]}
+
+where each event is [location id, command taken there (or null for the last), moves remaining, claimed bonus,
+inventory size]. The last three are null for events older than undo can reach (such as those that have left the
+in-memory tail of a JournalEventList). Sessions are saved with GameEngine.save and loaded with GameEngine.load.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+SAVE_VERSION = 1
+HASH_CHUNK = 1 << 20  # bytes of the game data file hashed at a time
+
+
+@dataclass
+class SavedSession:
+    """The contents of a save file.
+
+    Instance Attributes:
+        - world: the SHA-256 hash (in hex) of the game data file the session was played in
+        - location: the id of the player's current location
+        - visited: the ids of the locations whose long description the player has seen
+        - inventory: the names of the items the player carries, in the order they were picked up
+        - moves: how many moves the player has left
+        - bonus: whether the extra moves have been claimed
+        - events: for each event of the session, in order, its location id, the command taken there (None for
+          the last event), and the moves remaining, claimed bonus and inventory size right after it (or None for
+          each of these if undo cannot reach the event)
+
+    Representation Invariants:
+        - self.events != []
+        - self.events[-1][1] is None
+    """
+    world: str
+    location: int
+    visited: list[int]
+    inventory: list[str]
+    moves: int
+    bonus: bool
+    events: list[tuple[int, Optional[str], Optional[int], Optional[bool], Optional[int]]]
+
+
+# A mapping from the absolute path of a game data file to its modification time and content hash.
+_hash_cache: dict[str, tuple[int, str]] = {}
+
+
+def world_hash(game_data_file: str) -> str:
+    """Return the SHA-256 hash, in hex, of the given game data file, hashing it only if it has not been hashed
+    before or has been modified since."""
+    path = os.path.abspath(game_data_file)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _hash_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    _hash_cache[path] = (mtime, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def write_save(saved: SavedSession, filename: str) -> None:
+    """Write saved to the save file with the given filename, replacing it only once it is completely written."""
+    record = {'save': SAVE_VERSION, 'world': saved.world, 'location': saved.location, 'visited': saved.visited,
+              'inventory': saved.inventory, 'moves': saved.moves, 'bonus': saved.bonus, 'events': saved.events}
+    temporary = filename + '.tmp'
+    with open(temporary, 'w', encoding='utf-8') as f:
+        json.dump(record, f, separators=(',', ':'))
+        f.write('\n')
+    os.replace(temporary, filename)
+
+
+def read_save(filename: str) -> SavedSession:
+    """Return the session in the save file with the given filename.
+
+    Raise ValueError if the file is not a save file of this version.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        try:
+            record = json.load(f)
+        except json.JSONDecodeError:
+            record = None
+    if not isinstance(record, dict) or record.get('save') != SAVE_VERSION:
+        raise ValueError(f"{filename} is not a version {SAVE_VERSION} save file")
+    return SavedSession(record['world'], record['location'], record['visited'], record['inventory'],
+                        record['moves'], record['bonus'], [tuple(event) for event in record['events']])
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
@@ -0,0 +1,212 @@
+"""CSC111 Project 1: Text Adventure Game - Multi-Session Server
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module hosts the game for many players at once from one process. It is an asyncio TCP server with
+a line protocol: each connection is its own GameEngine session, every line the client sends is one line of
+input, and the server answers with the text the player would see followed by the next prompt. All sessions
+share the World loaded once by `adventure.load_world`, so an idle connection only costs its session state.
+
+    python server.py --port 4000          # then, e.g., nc localhost 4000
+
+A session ends when the game ends, when the client disconnects, or when it sends nothing for --timeout
+seconds. Clients that are programs rather than people can ask for every reply to end with a marker
+(--turn-end), so they know when the server is waiting for them. Output is flow-controlled: the server waits for
+a slow client to drain its output before reading its next line, so one session can never buffer unbounded
+output.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+from typing import Optional
+
+from adventure import load_world
+from game_engine import GameEngine
+from instrumentation import Stats
+
+DEFAULT_PORT = 4000
+DEFAULT_TIMEOUT = 300.0
+MAX_LINE = 1024  # longest line of input accepted from a client, in bytes
+WRITE_HIGH_WATER = 64 * 1024  # bytes of unsent output at which a session stops until its client catches up
+BACKLOG = 4096  # pending connections the listening socket queues, so bursts of new players are not refused
+TIMEOUT_MESSAGE = "\nYou have been idle for too long. Goodbye!\n"
+TURN_END = "\0"  # marker for scripted clients that the server is waiting for their next line
+FULL_MESSAGE = "The server is full; please try again later.\n"
+
+
+class GameServer:
+    """A TCP server running one game session per connection, all sharing one loaded world.
+
+    Instance Attributes:
+        - game_data_file: the game data file every session plays
+        - initial_location_id: the location every session starts at
+        - timeout: the seconds a session may wait for a line of input before it is closed
+        - max_sessions: the most sessions open at once, or None for no limit
+        - sessions: the number of sessions open right now
+        - stats: where every session records its performance statistics, or None if they are not recorded
+        - turn_end: the text sent after every prompt, marking that the server is waiting for input
+
+    Representation Invariants:
+        - self.timeout > 0
+        - self.max_sessions is None or self.max_sessions > 0
+        - 0 <= self.sessions
+
+    >>> async def demo() -> str:
+    ...     server = GameServer('game_data.json', 7)
+    ...     listener = await server.listen('127.0.0.1', 0)
+    ...     port = listener.sockets[0].getsockname()[1]
+    ...     reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    ...     writer.write(b"go south\\r\\nscore\\nquit\\n")
+    ...     transcript = (await reader.read()).decode()
+    ...     writer.close()
+    ...     listener.close()
+    ...     await listener.wait_closed()
+    ...     return transcript
+    >>> transcript = asyncio.run(demo())
+    >>> "You decided to: go south" in transcript, "invalid" in transcript, "You decided to: quit" in transcript
+    (True, False, True)
+    """
+    game_data_file: str
+    initial_location_id: int
+    timeout: float
+    max_sessions: Optional[int]
+    sessions: int
+    stats: Optional[Stats]
+    turn_end: str
+    # Private Instance Attributes:
+    #   - _handlers: the tasks running the open sessions
+
+    _handlers: set[asyncio.Task]
+
+    def __init__(self, game_data_file: str, initial_location_id: int, timeout: float = DEFAULT_TIMEOUT,
+                 max_sessions: Optional[int] = None, stats: Optional[Stats] = None, turn_end: str = "") -> None:
+        """Initialize a server for the given game, loading its world so that sessions start without parsing."""
+        self.game_data_file = game_data_file
+        self.initial_location_id = initial_location_id
+        self.timeout = timeout
+        self.max_sessions = max_sessions
+        self.sessions = 0
+        self.stats = stats
+        self.turn_end = turn_end
+        self._handlers = set()
+        load_world(game_data_file)
+
+    async def listen(self, host: str, port: int) -> asyncio.Server:
+        """Start accepting connections on the given host and port and return the listening asyncio server."""
+        return await asyncio.start_server(self._accept, host, port, limit=MAX_LINE, backlog=BACKLOG)
+
+    def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Start a session for the client connected through reader and writer, in a task of its own.
+
+        The server keeps the task rather than leaving it to asyncio.start_server, which (before Python 3.12)
+        reports a session cancelled at shutdown as an error.
+        """
+        task = asyncio.get_running_loop().create_task(self.handle(reader, writer))
+        self._handlers.add(task)
+        task.add_done_callback(self._handlers.discard)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Play one session with the client connected through reader and writer, until the game ends, the client
+        disconnects, or the client is idle for longer than self.timeout. If the server shuts down, the session is
+        closed and the cancellation carries on."""
+        if self.max_sessions is not None and self.sessions >= self.max_sessions:
+            await _send(writer, FULL_MESSAGE)
+            await _close(writer)
+            return
+        self.sessions += 1
+        writer.transport.set_write_buffer_limits(high=WRITE_HIGH_WATER)
+        try:
+            engine = GameEngine(self.game_data_file, self.initial_location_id, stats=self.stats)
+            result = engine.start()
+            while result.ongoing:
+                await _send(writer, result.output + result.prompt + self.turn_end)
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.timeout)
+                except asyncio.TimeoutError:
+                    await _send(writer, TIMEOUT_MESSAGE)
+                    return
+                except ValueError:  # a line longer than MAX_LINE, which is taken as an invalid command
+                    line = b"\n"
+                if not line:
+                    return
+                result = engine.step(_decode_line(line))
+            await _send(writer, result.output)
+        except ConnectionError:  # the client has gone
+            pass
+        finally:
+            self.sessions -= 1
+            await _close(writer)
+
+    async def serve_forever(self, host: str, port: int) -> None:
+        """Accept connections on the given host and port until cancelled."""
+        listener = await self.listen(host, port)
+        async with listener:
+            await listener.serve_forever()
+
+
+def _decode_line(line: bytes) -> str:
+    """Return the line of input a client sent as line, without its line ending, which the engine would otherwise
+    take as part of the command or answer.
+
+    >>> _decode_line(b"3843\\r\\n"), _decode_line(b"go south\\n"), _decode_line(b"quit")
+    ('3843', 'go south', 'quit')
+    """
+    return line.decode('utf-8', errors='replace').rstrip("\r\n")
+
+
+async def _send(writer: asyncio.StreamWriter, text: str) -> None:
+    """Write text to the client, waiting while more than WRITE_HIGH_WATER bytes of output are still unsent."""
+    if text:
+        writer.write(text.encode('utf-8'))
+        await writer.drain()
+
+
+async def _close(writer: asyncio.StreamWriter) -> None:
+    """Close the connection to the client, ignoring a client that has already gone."""
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except ConnectionError:
+        pass
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    parser = argparse.ArgumentParser(description="Host the text adventure game for many players over TCP.")
+    parser.add_argument('--data', default='game_data.json', help="game data file (default: game_data.json)")
+    parser.add_argument('--start', type=int, default=7, help="id of the starting location (default: 7)")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f"seconds a player may be idle before being disconnected (default: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument('--max-sessions', type=int, help="most players connected at once (default: no limit)")
+    parser.add_argument('--turn-end', action='store_const', const=TURN_END, default="",
+                        help="end every reply with a NUL byte, for scripted clients such as loadtest.py")
+    args = parser.parse_args()
+
+    game_server = GameServer(args.data, args.start, args.timeout, args.max_sessions, turn_end=args.turn_end)
+    print(f"serving {args.data} on {args.host}:{args.port}")
+    try:
+        asyncio.run(game_server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
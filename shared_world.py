@@ -0,0 +1,117 @@
+"""CSC111 Project 1: Text Adventure Game - Shared Memory World
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module lets the worker processes of a pool share one copy of a World instead of each parsing the
+game data file into objects of its own. The parent process encodes the world once, in the binary world format
+of binary_world (flat tables of locations, commands, items and puzzles, and a table of every string), into a
+multiprocessing.shared_memory segment:
+
+    with SharedWorld('game_data.json', starts=[7]) as shared:
+        ... start workers, passing them shared.name and the game data file ...
+
+and each worker attaches to the segment by name:
+
+    attach_world(name, 'game_data.json')
+
+which loads a World reading straight from the shared segment (nothing is copied or parsed, and text is only
+decoded when a session shows it) and makes load_world return it for that game data file. However many workers
+there are, the world's text is in memory once. The world is checked by world_analyzer once, for games starting
+at each of the given starts, before it is shared; games in attached worlds skip the check, which would otherwise
+decode the whole world in every worker. batch_runner.py and fuzzer.py take --shared-memory to work this way.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from multiprocessing import shared_memory
+from typing import Iterable, Optional
+
+from adventure import register_world
+from binary_world import encode_world, is_binary_world, world_from_buffer
+from game_entities import World
+from world_analyzer import check_world
+
+
+class SharedWorld:
+    """The binary encoding of a game data file's world in a shared memory segment, owned by the process that
+    created it. The segment is removed by close, or on leaving a with block.
+
+    Instance Attributes:
+        - name: the name workers attach to the segment by
+        - size: the size of the encoded world, in bytes
+    """
+    # Private Instance Attributes:
+    #   - _segment: the shared memory segment, or None once it is closed
+    name: str
+    size: int
+    _segment: Optional[shared_memory.SharedMemory]
+
+    def __init__(self, game_data_file: str, starts: Iterable[int] = ()) -> None:
+        """Encode the world in the given game data file (JSON or binary) into a new shared memory segment, after
+        checking it with world_analyzer for games starting at each of starts.
+
+        Raise ValueError if the world is broken.
+        """
+        if is_binary_world(game_data_file):
+            with open(game_data_file, 'rb') as f:
+                data = f.read()
+        else:
+            data = encode_world(game_data_file)
+        world = world_from_buffer(memoryview(data), game_data_file)
+        for start in starts:
+            check_world(game_data_file, world, start)
+        self._segment = shared_memory.SharedMemory(create=True, size=len(data))
+        self._segment.buf[:len(data)] = data
+        self.name = self._segment.name
+        self.size = len(data)
+
+    def __enter__(self) -> SharedWorld:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the segment. Workers still attached keep their mapping until they exit."""
+        if self._segment is not None:
+            self._segment.close()
+            self._segment.unlink()
+            self._segment = None
+
+
+# A mapping from the name of every segment this process has attached to, to the segment, kept open for as long
+# as the process runs because the World attached from it reads from it.
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+def attach_world(name: str, game_data_file: str) -> World:
+    """Return the World in the shared memory segment with the given name, created by a SharedWorld of the given
+    game data file, and make load_world(game_data_file) return it in this process from now on."""
+    segment = _attached.get(name)
+    if segment is None:
+        segment = _attached[name] = shared_memory.SharedMemory(name=name)
+    world = world_from_buffer(segment.buf, f"shared memory segment {name}")
+    register_world(game_data_file, world)
+    return world
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
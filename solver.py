@@ -0,0 +1,259 @@
+"""CSC111 Project 1: Text Adventure Game - Walkthrough Solver
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module finds a shortest winning walkthrough of a game: the fewest commands (puzzle answers
+included) that end with a successful "submit project" before the player runs out of moves. It searches the
+game state (location, inventory, extra moves claimed, moves remaining) with A*, following the same rules as
+GameEngine, and checks its answer by playing it through a GameEngine.
+
+    python solver.py --data game_data.json --start 7
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import heapq
+import json
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from adventure import AdventureGame
+from game_engine import GameEngine, MAX_MOVES, WIN_SCORE
+from commands import Blackjack, Bonus, Door, Move, Pickup, PuzzleCommand, Reward, Submit
+from game_entities import World
+from navigation import MOVE_PREFIX
+
+MOVES_BITS = 8  # bits of a packed state holding the moves remaining
+
+
+@dataclass
+class Solution:
+    """The result of a search for a winning walkthrough.
+
+    Instance Attributes:
+        - commands: a shortest winning list of commands, or None if the game cannot be won
+        - expanded: the number of states taken off the frontier and expanded
+        - generated: the number of states put on the frontier
+        - seconds: how long the search took
+    """
+    commands: Optional[list[str]]
+    expanded: int
+    generated: int
+    seconds: float
+
+
+@dataclass
+class _Transition:
+    """One thing the player can do at a location, as the solver sees it.
+
+    Instance Attributes:
+        - commands: the lines of input that do it (the command followed by any answers)
+        - target: the location id the player ends up at
+        - costs_move: whether it uses up a move (when target differs from where it was done)
+        - gain: the bit of the item it adds to the inventory, or 0
+        - needs: the inventory bits that must all be present for it to work
+        - blocked_by: the inventory bits that must all be absent for it to work
+        - bonus: whether it claims the extra moves
+    """
+    commands: tuple[str, ...]
+    target: int
+    costs_move: bool
+    gain: int = 0
+    needs: int = 0
+    blocked_by: int = 0
+    bonus: bool = False
+
+
+class Solver:
+    """An A* search for the shortest winning walkthrough of a World.
+
+    States are packed into a single int: moves remaining in the low MOVES_BITS bits, then the extra-moves flag,
+    the inventory bitmask and the index of the location. The heuristic is the fewest commands from a location to
+    one where the project can be submitted, counting puzzle shortcuts as well as "go" commands, plus one for the
+    submission itself; it never overestimates, so the first winning state found is a shortest one.
+
+    >>> solution = Solver(AdventureGame('game_data.json', 7).world).solve(7)
+    >>> len(solution.commands), solution.commands[-1]
+    (31, 'submit project')
+    """
+    # Private Instance Attributes:
+    #   - _world: the world being solved
+    #   - _ids: the location id at each location index
+    #   - _index: a mapping from location id to location index
+    #   - _item_bits: a mapping from item name to its inventory bit
+    #   - _values: the points of the item of each inventory bit, by bit index
+    #   - _points: a cache of the score of each inventory bitmask whose score has been needed
+    #   - _transitions: the transitions available at each location index
+    #   - _submit: a mapping from the index of each location where the project can be submitted to the command
+    #     submitting it
+    #   - _estimate: a lower bound on the commands needed to win from each location index
+    _world: World
+    _ids: list[int]
+    _index: dict[int, int]
+    _item_bits: dict[str, int]
+    _values: list[int]
+    _points: dict[int, int]
+    _transitions: list[list[_Transition]]
+    _submit: dict[int, str]
+    _estimate: list[float]
+
+    def __init__(self, world: World) -> None:
+        """Compile the rules of world into transitions between location indexes."""
+        self._world = world
+        self._ids = list(world.locations)
+        self._index = {loc_id: i for i, loc_id in enumerate(self._ids)}
+        self._item_bits = {name: 1 << i for i, name in enumerate(world.items)}
+        self._values = [item.target_points for item in world.items.values()]
+        self._points = {}
+        self._transitions = [self._compile(loc_id) for loc_id in self._ids]
+        self._submit = {i: command for i, loc_id in enumerate(self._ids)
+                        for command, handler in world.commands.at(loc_id).items() if isinstance(handler, Submit)}
+        self._estimate = self._estimates()
+
+    def _score(self, inventory: int) -> int:
+        """Return the score of the inventory bitmask inventory, summing its points the first time it is needed."""
+        points = self._points.get(inventory)
+        if points is None:
+            points = sum(value for i, value in enumerate(self._values) if inventory >> i & 1)
+            self._points[inventory] = points
+        return points
+
+    def _compile(self, loc_id: int) -> list[_Transition]:
+        """Return the transitions of the location with the given id, following the command handlers of the world."""
+        location = self._world.locations[loc_id]
+        transitions = []
+        for command, handler in self._world.commands.at(loc_id).items():
+            target = location.available_commands[command]
+            if isinstance(handler, Move) and command.startswith(MOVE_PREFIX):
+                transitions.append(_Transition((command,), target, target != loc_id))
+            elif isinstance(handler, Pickup):
+                bit = self._item_bits[handler.item]
+                transitions.append(_Transition((command,), target, target != loc_id, gain=bit, blocked_by=bit))
+            elif not isinstance(handler, PuzzleCommand) or target != loc_id:
+                continue
+            elif isinstance(handler, Reward) and handler.puzzle.answer:
+                bit = self._item_bits[handler.item]
+                transitions.append(_Transition((command, handler.puzzle.answer[0]), target, False, gain=bit,
+                                               needs=self._item_bits.get(handler.puzzle.requires, 0),
+                                               blocked_by=bit))
+            elif isinstance(handler, Door) and handler.puzzle.answer:
+                next_loc = handler.puzzle.next_loc
+                transitions.append(_Transition((command, handler.puzzle.answer[0]), next_loc, next_loc != loc_id))
+            elif isinstance(handler, Blackjack):
+                transitions.append(_Transition((command, "stand", "n"), handler.puzzle.next_loc, False))
+            elif isinstance(handler, Bonus):
+                transitions.append(_Transition((command,), handler.puzzle.next_loc, False, bonus=True))
+        return [t for t in transitions if t.target in self._index]
+
+    def _estimates(self) -> list[float]:
+        """Return the fewest commands needed to get from each location index to a submission, and submit."""
+        incoming = [[] for _ in self._ids]
+        for i, transitions in enumerate(self._transitions):
+            for transition in transitions:
+                incoming[self._index[transition.target]].append((i, len(transition.commands)))
+        estimate = [float('inf')] * len(self._ids)
+        heap = []
+        for i in self._submit:
+            estimate[i] = 1
+            heap.append((1, i))
+        heapq.heapify(heap)
+        while heap:
+            cost, i = heapq.heappop(heap)
+            if cost > estimate[i]:
+                continue
+            for source, length in incoming[i]:
+                if cost + length < estimate[source]:
+                    estimate[source] = cost + length
+                    heapq.heappush(heap, (cost + length, source))
+        return estimate
+
+    def solve(self, start: int, max_moves: int = MAX_MOVES, win_score: int = WIN_SCORE) -> Solution:
+        """Return a shortest winning walkthrough from the location with id start."""
+        began = time.perf_counter()
+        item_count = len(self._item_bits)
+        moves_mask = (1 << MOVES_BITS) - 1
+        start_state = self._index[start] << (item_count + 1 + MOVES_BITS) | max_moves
+        best = {start_state: 0}
+        parents: dict[int, tuple[int, tuple[str, ...]]] = {}
+        frontier = [(self._estimate[self._index[start]], 0, start_state)]
+        expanded = generated = 0
+        while frontier:
+            _, cost, state = heapq.heappop(frontier)
+            if cost > best[state]:
+                continue
+            expanded += 1
+            moves = state & moves_mask
+            bonus = state >> MOVES_BITS & 1
+            inventory = state >> (MOVES_BITS + 1) & ((1 << item_count) - 1)
+            loc = state >> (item_count + 1 + MOVES_BITS)
+            if loc in self._submit and self._score(inventory) == win_score:
+                commands = [self._submit[loc]]
+                while state in parents:
+                    state, step = parents[state]
+                    commands[:0] = step
+                return Solution(commands, expanded, generated, time.perf_counter() - began)
+            if moves == 0:
+                continue
+            for t in self._transitions[loc]:
+                if inventory & t.needs != t.needs or inventory & t.blocked_by or (t.bonus and bonus):
+                    continue
+                new_moves = moves - t.costs_move + 10 * t.bonus
+                new_state = (self._index[t.target] << (item_count + 1 + MOVES_BITS)
+                             | (inventory | t.gain) << (MOVES_BITS + 1)
+                             | (bonus | t.bonus) << MOVES_BITS | min(new_moves, moves_mask))
+                new_cost = cost + len(t.commands)
+                if new_cost < best.get(new_state, new_cost + 1):
+                    best[new_state] = new_cost
+                    parents[new_state] = (state, t.commands)
+                    generated += 1
+                    heapq.heappush(frontier, (new_cost + self._estimate[self._index[t.target]], new_cost,
+                                              new_state))
+        return Solution(None, expanded, generated, time.perf_counter() - began)
+
+
+def verify(game_data_file: str, start: int, commands: list[str]) -> bool:
+    """Return whether playing commands through a GameEngine from start wins the game with the last command."""
+    engine = GameEngine(game_data_file, start, render=False)
+    commands_at = engine.game.world.commands.at
+    for i, command in enumerate(commands):
+        submitting = isinstance(commands_at(engine.game.current_location_id).get(command), Submit)
+        result = engine.step(command)
+        if not result.accepted or not result.ongoing:
+            return i == len(commands) - 1 and submitting and engine.game.score == WIN_SCORE
+    return False
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    parser = argparse.ArgumentParser(description="Find a shortest winning walkthrough.")
+    parser.add_argument('--data', default='game_data.json', help="game data file (default: game_data.json)")
+    parser.add_argument('--start', type=int, default=7, help="starting location id (default: 7)")
+    args = parser.parse_args()
+
+    solution = Solver(AdventureGame(args.data, args.start).world).solve(args.start)
+    if solution.commands is None:
+        print("The game cannot be won.")
+    else:
+        print(json.dumps(solution.commands))
+        print(f"{len(solution.commands)} commands, verified: {verify(args.data, args.start, solution.commands)}")
+    print(f"{solution.expanded} states expanded, {solution.generated} generated in {solution.seconds * 1000:.1f} ms")
@@ -0,0 +1,258 @@
+"""CSC111 Project 1: Text Adventure Game - Streaming Game Data Loader
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module loads game data JSON files without ever holding a whole file, or its whole parsed tree, in
+memory. The file is read a chunk at a time, and each record of the "locations", "items" and "puzzles" arrays is
+parsed on its own and turned into a Location, Item or Puzzle straight away, so besides the entities themselves
+the loader only holds one chunk and one record at a time.
+
+The references between records are checked in the same pass: every command must lead to a location, every
+item's start and target position and every puzzle's loc and next_loc must be a location, and every item listed
+at a location must have an item record. Only the ids of locations and names of items referred to but not read
+yet are remembered, until they are read. Broken references are reported
+together in one ValueError, as are records that are missing fields.
+
+Commands are shared between the locations that have them, as json.load shares them within a file, so the
+loaded locations take no more memory than if the whole file had been parsed at once.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import re
+from typing import Any, Iterator, Mapping, TextIO
+
+from game_entities import Location, Item, Puzzle
+
+CHUNK_SIZE = 1 << 16  # characters read from the file at a time
+SECTIONS = ('locations', 'items', 'puzzles')
+MAX_REPORTED = 10  # problems listed in the error for a file with broken references
+_WHITESPACE = ' \t\n\r'
+_NOT_WHITESPACE = re.compile(r'[^ \t\n\r]')
+_SEPARATOR = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*')  # what follows an element of an array
+_decoder = json.JSONDecoder()
+
+
+class _JSONStream:
+    """A JSON text read from a file a chunk at a time, from which values are taken one after another."""
+    # Private Instance Attributes:
+    #   - _file: the file being read
+    #   - _chunk_size: the number of characters read at a time
+    #   - _buffer: the text read but not yet consumed, starting at _pos
+    #   - _pos: the position in _buffer of the next character to consume
+    #   - _done: whether the whole file has been read
+    _file: TextIO
+    _chunk_size: int
+    _buffer: str
+    _pos: int
+    _done: bool
+
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._pos = 0
+        self._done = False
+
+    def _fill(self) -> bool:
+        """Read the next chunk of the file, dropping the text already consumed, and return whether there was any."""
+        chunk = '' if self._done else self._file.read(self._chunk_size)
+        self._done = chunk == ''
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return not self._done
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end of the file."""
+        while True:
+            match = _NOT_WHITESPACE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return self._buffer[self._pos]
+            self._pos = len(self._buffer)
+            if not self._fill():
+                return ''
+
+    def take(self, char: str) -> None:
+        """Consume the next character, which must be char.
+
+        Raise ValueError if it is not.
+        """
+        if self.peek() != char:
+            raise ValueError(f"expected {char!r} but found {self.peek() or 'the end of the file'!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Consume and return the next JSON value.
+
+        Raise ValueError if it is not valid JSON.
+        """
+        if self._pos >= len(self._buffer) or self._buffer[self._pos] in _WHITESPACE:
+            self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as error:
+                if self._fill():
+                    continue
+                raise ValueError(f"invalid JSON: {error.msg}") from None
+            if end < len(self._buffer) or not self._fill():  # a number could carry on in the next chunk
+                self._pos = end
+                return value
+
+    def array(self) -> Iterator[Any]:
+        """Consume a JSON array, yielding its elements one at a time."""
+        self.take('[')
+        if self.peek() == ']':
+            self.take(']')
+            return
+        while True:
+            yield self.value()
+            match = _SEPARATOR.match(self._buffer, self._pos)
+            if match is not None and match.end() < len(self._buffer):
+                self._pos = match.end()
+                if match.group(1) == ']':
+                    return
+            elif self.peek() == ',':  # the separator may carry on into the next chunk
+                self.take(',')
+            else:
+                self.take(']')
+                return
+
+
+def iter_records(file: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """Yield (section, record) for each record of the "locations", "items" and "puzzles" arrays of the game data
+    JSON in file, in the order they appear, reading file a chunk of chunk_size characters at a time. Any other
+    member of the top-level object is skipped.
+
+    >>> import io
+    >>> text = '{"version": 2, "items": [{"name": "pen"}], "locations": [{"id": 1}, {"id": 2}], "puzzles": []}'
+    >>> list(iter_records(io.StringIO(text), chunk_size=8))
+    [('items', {'name': 'pen'}), ('locations', {'id': 1}), ('locations', {'id': 2})]
+    """
+    stream = _JSONStream(file, chunk_size)
+    stream.take('{')
+    if stream.peek() == '}':
+        return
+    while True:
+        key = stream.value()
+        stream.take(':')
+        if key in SECTIONS and stream.peek() == '[':
+            for record in stream.array():
+                yield key, record
+        else:
+            stream.value()
+        if stream.peek() != ',':
+            stream.take('}')
+            return
+        stream.take(',')
+
+
+def load_game_data(filename: str, chunk_size: int = CHUNK_SIZE) \
+        -> tuple[dict[int, Location], dict[str, Item], dict[int, Puzzle]]:
+    """Return the locations by id, items by name and puzzles by location id in the game data JSON file with the
+    given filename, checking the references between them as they are read.
+
+    Raise ValueError if the file is not valid JSON, if a record is missing a field, or if a reference leads to
+    no location or item.
+    """
+    locations, items, puzzles = {}, {}, {}
+    unresolved = set()  # the ids of locations referred to but not read yet
+    unnamed = set()  # the names of items listed at locations but not read yet
+    commands = {}  # every distinct command read, to share between the locations that have it
+    problems = []
+    read = dict.fromkeys(SECTIONS, 0)  # the number of records read from each section
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        for section, record in iter_records(f, chunk_size):
+            number = read[section]
+            read[section] += 1
+            try:
+                if section == 'locations':
+                    available = {commands.setdefault(command, command): target
+                                 for command, target in record['available_commands'].items()}
+                    location = Location(record['id'], record['brief_description'], record['long_description'],
+                                        available, record['items'], False, record.get('name', ''))
+                    if location.id_num in locations:
+                        problems.append(f"location {location.id_num} appears more than once")
+                    locations[location.id_num] = location
+                    unresolved.discard(location.id_num)
+                    unnamed.update(name for name in location.items if name not in items)
+                    references = available.values()
+                elif section == 'items':
+                    item = Item(record['name'], record['description'], record['start_position'],
+                                record['target_position'], record['target_points'])
+                    items[item.name] = item
+                    unnamed.discard(item.name)
+                    references = (item.start_position, item.target_position)
+                else:
+                    puzzle = Puzzle(record['prompt'], record['loc'], record['win'], record['next_loc'],
+                                    record['lose'], record['answer'], record['dialogue'], record.get('kind', ''),
+                                    record.get('command', ''), record.get('requires', ''), record.get('done', ''))
+                    puzzles[puzzle.loc] = puzzle
+                    references = (puzzle.loc, puzzle.next_loc)
+            except (KeyError, TypeError, AttributeError) as error:
+                problems.append(f"record {number} of {section} is malformed ({type(error).__name__}: {error})")
+                continue
+            for loc_id in references:
+                if loc_id not in locations:
+                    unresolved.add(loc_id)
+
+    if unresolved or unnamed:
+        problems.extend(broken_references(unresolved, unnamed, locations, items, puzzles))
+    if problems:
+        shown = "\n  ".join(problems[:MAX_REPORTED])
+        more = f"\n  ... and {len(problems) - MAX_REPORTED} more" if len(problems) > MAX_REPORTED else ""
+        raise ValueError(f"{filename} has {len(problems)} problem(s):\n  {shown}{more}")
+    return locations, items, puzzles
+
+
+def broken_references(missing: set[int], unnamed: set[str], locations: Mapping[int, Location],
+                      items: Mapping[str, Item], puzzles: Mapping[int, Puzzle]) -> list[str]:
+    """Return a description of every reference to a location whose id is in missing, and of every location
+    listing an item whose name is in unnamed.
+
+    >>> locations = {1: Location(1, 'a', 'a', {'go east': 2}, ['pen'], False)}
+    >>> for problem in broken_references({2}, {'pen'}, locations, {}, {}):
+    ...     print(problem)
+    command 'go east' of location 1 leads to missing location 2
+    location 1 lists item 'pen', which has no item record
+    """
+    problems = []
+    for location in locations.values():
+        problems.extend(f"command {command!r} of location {location.id_num} leads to missing location {target}"
+                        for command, target in location.available_commands.items() if target in missing)
+    for item in items.values():
+        problems.extend(f"{field} of item {item.name!r} is missing location {loc_id}"
+                        for field, loc_id in (('start_position', item.start_position),
+                                              ('target_position', item.target_position)) if loc_id in missing)
+    for puzzle in puzzles.values():
+        problems.extend(f"{field} of the puzzle at {puzzle.loc} is missing location {loc_id}"
+                        for field, loc_id in (('loc', puzzle.loc), ('next_loc', puzzle.next_loc))
+                        if loc_id in missing)
+    problems.extend(f"location {location.id_num} lists item {name!r}, which has no item record"
+                    for location in locations.values() for name in location.items if name in unnamed)
+    return problems
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
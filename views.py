@@ -0,0 +1,95 @@
+"""CSC111 Project 1: Text Adventure Game - Location Views
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the pre-rendered views of a game world's locations. The view of a location is the
+whole text a player is shown on arriving there: its description (brief if they have been there before, long if
+not), the menu, and the commands they can enter there. A location's two views are built once for each menu
+(sessions recording statistics have one more option), as one string each, so a turn's output is a cached string
+rather than a line of text per command.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from typing import Mapping
+
+from game_entities import Location
+
+MENU_PROMPT = "What to do? Choose from: "
+COMMANDS_LINE = "At this location, you can also:"
+
+
+def render_view(location: Location, description: str, menu: tuple[str, ...]) -> str:
+    """Return the view of location with the given description and menu options, one line of text per line of
+    the view.
+
+    >>> hall = Location(1, 'A hall.', 'A long hall.', {'go east': 2}, [], False)
+    >>> print(render_view(hall, 'A hall.', ('look', 'quit', 'stats')), end='')
+    A hall.
+    What to do? Choose from: look, quit, stats
+    At this location, you can also:
+    - go east
+    """
+    lines = [description, MENU_PROMPT + ", ".join(menu), COMMANDS_LINE]
+    lines.extend(f"- {command}" for command in location.available_commands)
+    lines.append("")
+    return "\n".join(lines)
+
+
+class ViewTable:
+    """The views of every location of a world, as the player sees them before and after having been there.
+
+    Like a NavigationIndex, the views of a location are built the first time it is shown, or all up front by
+    precompute, and are then shared by every session played in the world.
+    """
+    # Private Instance Attributes:
+    #   - _locations: the locations whose views are built
+    #   - _views: a mapping from each menu to a mapping from location id to its view with the long description and
+    #     its view with the brief one
+    _locations: Mapping[int, Location]
+    _views: dict[tuple[str, ...], dict[int, tuple[str, str]]]
+
+    def __init__(self, locations: Mapping[int, Location]) -> None:
+        """Initialize the view table of locations. No view is built yet."""
+        self._locations = locations
+        self._views = {}
+
+    def view(self, loc_id: int, visited: bool, menu: tuple[str, ...]) -> str:
+        """Return the view of the location with the given id, listing the options of menu, for a player who has
+        been there before if visited."""
+        table = self._views.get(menu)
+        if table is None:
+            table = self._views[menu] = {}
+        views = table.get(loc_id)
+        if views is None:
+            location = self._locations[loc_id]
+            views = table[loc_id] = (render_view(location, location.long_description, menu),
+                                     render_view(location, location.brief_description, menu))
+        return views[visited]
+
+    def precompute(self, menu: tuple[str, ...]) -> None:
+        """Build the views of every location with the options of menu."""
+        for loc_id in self._locations:
+            self.view(loc_id, False, menu)
+
+
+if __name__ == "__main__":
+    pass
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
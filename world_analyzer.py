@@ -0,0 +1,257 @@
+"""CSC111 Project 1: Text Adventure Game - World Analyzer
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module finds broken game data when a game starts rather than when a player runs into it. The
+analysis walks the locations, items and puzzles of a world once, in time linear in the size of the world:
+
+    - every command, item position and puzzle loc and next_loc must be a location, and every item listed at a
+      location must have an item record (the checks streaming_loader makes as a JSON file is read, made again
+      here for worlds loaded any other way, such as binary and shared memory worlds)
+    - every puzzle must be of a known kind, be started by a command its location has, and require (if anything)
+      an item that exists
+    - every location should be reachable from the start, through commands and the puzzles that move the player
+
+A world with a broken reference or puzzle is broken: AdventureGame refuses to start in it, raising a ValueError.
+Unreachable locations are only reported, by this module's command line:
+
+    python world_analyzer.py game_data.json --start 7
+
+Analyses are cached on disk, keyed by the SHA-256 hash of the game data file (and the start), so a file is only
+analyzed again once it changes, however many times games are started in it. Worlds shared with worker processes
+by shared_world.SharedWorld are checked once, by the process sharing them, rather than by every worker.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from commands import PUZZLE_KINDS
+from game_entities import World
+from savegame import world_hash
+from streaming_loader import broken_references
+
+ANALYSIS_VERSION = 3
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                         'text-adventure', 'analysis')
+
+
+@dataclass
+class Analysis:
+    """The problems found in a world.
+
+    Instance Attributes:
+        - errors: descriptions of the broken references and inconsistent puzzles of the world
+        - unreachable: the ids of the locations the player cannot get to from the start, in increasing order
+    """
+    errors: list[str]
+    unreachable: list[int]
+
+
+def analyze(world: World, start: int) -> Analysis:
+    """Return the problems of world, for games starting at the location with id start.
+
+    >>> from game_entities import Location, Item, Puzzle
+    >>> locations = {1: Location(1, 'a', 'a', {'go east': 2, 'use door': 1}, ['pen'], False),
+    ...              2: Location(2, 'b', 'b', {'go west': 1, 'go up': 9}, [], False),
+    ...              3: Location(3, 'c', 'c', {'go west': 2}, [], False)}
+    >>> items = {'pen': Item('pen', 'A pen.', 1, 1, 5)}
+    >>> puzzles = {2: Puzzle('Code? ', 2, 'Open!', 8, 'No.', ['42'], 'A door.', 'door', 'use door', 'key')}
+    >>> analysis = analyze(World(locations, items, puzzles), 1)
+    >>> for error in analysis.errors:
+    ...     print(error)
+    command 'go up' of location 2 leads to missing location 9
+    next_loc of the puzzle at 2 is missing location 8
+    the puzzle at 2 is started by 'use door', which location 2 does not have
+    the puzzle at 2 requires missing item 'key'
+    >>> analysis.unreachable
+    [3]
+    """
+    locations, items, puzzles = world.locations, world.items, world.puzzles
+    errors = []
+    if start not in locations:
+        errors.append(f"the start {start} is not a location")
+
+    missing, unnamed = set(), set()
+    for location in locations.values():
+        missing.update(target for target in location.available_commands.values() if target not in locations)
+        unnamed.update(name for name in location.items if name not in items)
+    for item in items.values():
+        missing.update(loc_id for loc_id in (item.start_position, item.target_position) if loc_id not in locations)
+    for puzzle in puzzles.values():
+        missing.update(loc_id for loc_id in (puzzle.loc, puzzle.next_loc) if loc_id not in locations)
+    if missing or unnamed:
+        errors.extend(broken_references(missing, unnamed, locations, items, puzzles))
+
+    for puzzle in puzzles.values():
+        location = locations.get(puzzle.loc)  # a puzzle at a missing location is reported above
+        if location is not None and puzzle.command not in location.available_commands:
+            errors.append(f"the puzzle at {puzzle.loc} is started by {puzzle.command!r}, which location "
+                          f"{puzzle.loc} does not have")
+        if puzzle.kind not in PUZZLE_KINDS:
+            errors.append(f"the puzzle at {puzzle.loc} is of unknown kind {puzzle.kind!r}")
+        if puzzle.requires and puzzle.requires not in items:
+            errors.append(f"the puzzle at {puzzle.loc} requires missing item {puzzle.requires!r}")
+
+    reached = {start} if start in locations else set()
+    queue = deque(reached)
+    while queue:
+        loc_id = queue.popleft()
+        targets = list(locations[loc_id].available_commands.values())
+        if loc_id in puzzles:
+            targets.append(puzzles[loc_id].next_loc)
+        for target in targets:
+            if target in locations and target not in reached:
+                reached.add(target)
+                queue.append(target)
+    unreachable = sorted(loc_id for loc_id in locations if loc_id not in reached) if reached else []
+    return Analysis(errors, unreachable)
+
+
+# A mapping from (absolute path, modification time, start) to the analysis of that game data file, so a file is
+# only looked up in the disk cache once per process.
+_analyses: dict[tuple[str, int, int], Analysis] = {}
+
+
+def cached_analysis(game_data_file: str, world: World, start: int, cache_dir: str = CACHE_DIR) -> Analysis:
+    """Return the analysis of world, the world in the given game data file, for games starting at start: from
+    memory or the disk cache in cache_dir if the file has been analyzed before, and by analyze otherwise (saving
+    the result to the disk cache)."""
+    path = os.path.abspath(game_data_file)
+    key = (path, os.stat(path).st_mtime_ns, start)
+    analysis = _analyses.get(key)
+    if analysis is not None:
+        return analysis
+    cache_file = os.path.join(cache_dir, f"{world_hash(path)}-{start}.json")
+    analysis = _read_analysis(cache_file)
+    if analysis is None:
+        analysis = analyze(world, start)
+        _write_analysis(analysis, cache_file)
+    _analyses[key] = analysis
+    return analysis
+
+
+def check_world(game_data_file: str, world: World, start: int) -> None:
+    """Check that world, the world in the given game data file, is not broken, for games starting at start.
+
+    Every location of world is read unless the file's analysis is cached, so a lazily decoded world is best
+    checked once, by the process that shares it, rather than by each process using it.
+
+    Raise ValueError describing the errors of the world if it is broken.
+
+    Worlds that are not read by streaming_loader, such as binary and shared memory worlds, are checked all the same:
+
+    >>> import tempfile
+    >>> from adventure import AdventureGame
+    >>> from binary_world import compile_world
+    >>> from shared_world import SharedWorld
+    >>> with open('game_data.json', 'r', encoding='utf-8') as f:
+    ...     data = json.load(f)
+    >>> data['locations'][0]['available_commands']['go up'] = 9999
+    >>> data['puzzles'][0]['next_loc'] = 8888
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     json_file, binary_file = os.path.join(directory, 'broken.json'), os.path.join(directory, 'broken.bin')
+    ...     with open(json_file, 'w', encoding='utf-8') as f:
+    ...         json.dump(data, f)
+    ...     compile_world(json_file, binary_file)
+    ...     for load in (lambda: AdventureGame(binary_file, 7), lambda: SharedWorld(json_file, [7])):
+    ...         try:
+    ...             load()
+    ...         except ValueError as error:
+    ...             print(str(error).replace(directory + os.sep, ''))
+    broken.bin is broken:
+      command 'go up' of location 7 leads to missing location 9999
+      next_loc of the puzzle at 7 is missing location 8888
+    broken.json is broken:
+      command 'go up' of location 7 leads to missing location 9999
+      next_loc of the puzzle at 7 is missing location 8888
+    """
+    errors = cached_analysis(game_data_file, world, start).errors
+    if errors:
+        raise ValueError(f"{game_data_file} is broken:\n  " + "\n  ".join(errors))
+
+
+def _read_analysis(cache_file: str) -> Optional[Analysis]:
+    """Return the analysis in cache_file, or None if there is no usable one."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict) or record.get('analysis') != ANALYSIS_VERSION:
+        return None
+    return Analysis(record['errors'], record['unreachable'])
+
+
+def _write_analysis(analysis: Analysis, cache_file: str) -> None:
+    """Save analysis to cache_file, if it can be written. The cache only saves time, so failing to write it is
+    not an error."""
+    temporary = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump({'analysis': ANALYSIS_VERSION, 'errors': analysis.errors, 'unreachable': analysis.unreachable},
+                      f, separators=(',', ':'))
+        os.replace(temporary, cache_file)
+    except OSError:
+        pass
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the analyzer command line and return its exit status (1 if the world is broken)."""
+    from adventure import load_world  # adventure checks worlds with this module, so it is imported late
+
+    parser = argparse.ArgumentParser(description="Check a game data file for broken references, inconsistent "
+                                                 "puzzles and unreachable locations.")
+    parser.add_argument('data', nargs='?', default='game_data.json', help="game data file (default: game_data.json)")
+    parser.add_argument('--start', type=int, default=7, help="starting location id (default: 7)")
+    parser.add_argument('--no-cache', action='store_true', help="analyze the file even if it was analyzed before")
+    args = parser.parse_args(argv)
+
+    world = load_world(args.data)
+    began = time.perf_counter()
+    if args.no_cache:
+        analysis = analyze(world, args.start)
+    else:
+        analysis = cached_analysis(args.data, world, args.start)
+    elapsed = time.perf_counter() - began
+
+    for error in analysis.errors:
+        print(f"error: {error}")
+    if analysis.unreachable:
+        shown = ", ".join(map(str, analysis.unreachable[:20]))
+        more = ", ..." if len(analysis.unreachable) > 20 else ""
+        print(f"warning: {len(analysis.unreachable)} location(s) cannot be reached from {args.start}: {shown}{more}")
+    print(f"{len(world.locations)} locations, {len(analysis.errors)} error(s), "
+          f"{len(analysis.unreachable)} unreachable, in {elapsed * 1000:.1f}ms")
+    return 1 if analysis.errors else 0
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""CSC111 Project 1: Text Adventure Game - Synthetic World Generator
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module writes synthetic game data files of any size, for measuring how load time, memory and
+per-step latency grow with the world. A generated world follows the same schema as game_data.json:
+
+    - locations are numbered from 1, named "Room <id>", and joined either as a grid (go north/south/east/west)
+      or as a random connected graph (go passage <k>); every passage can be walked both ways
+    - location 1 is the start, where the project is submitted
+    - every item lies in its own location, picked up with "pickup <item name>", and is delivered to location 1;
+      when there are at most WIN_SCORE items their points add up to WIN_SCORE, so the world can be won
+    - every puzzle is a locked door ("use back door") whose code is given in its dialogue and which leads to
+      another random location
+
+    python world_generator.py big_world.json --locations 100000 --topology random --items 10 --puzzles 50
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import json
+import math
+import random
+from typing import Iterator, Optional
+
+from game_engine import WIN_SCORE
+
+START = 1
+TOPOLOGIES = ('grid', 'random')
+FILLER = ("The walls are lined with shelves of old textbooks and the air smells faintly of coffee. Somewhere a "
+          "radiator hums. ")
+
+
+def _grid_exits(loc_id: int, n: int, width: int) -> dict[str, int]:
+    """Return the go commands of location loc_id in a grid of n locations, width locations wide."""
+    row, col = divmod(loc_id - 1, width)
+    exits = {}
+    if row > 0:
+        exits["go north"] = loc_id - width
+    if loc_id + width <= n:
+        exits["go south"] = loc_id + width
+    if col > 0:
+        exits["go west"] = loc_id - 1
+    if col < width - 1 and loc_id < n:
+        exits["go east"] = loc_id + 1
+    return exits
+
+
+def _random_graph(n: int, extra_edges: int, rng: random.Random) -> list[dict[str, int]]:
+    """Return the go commands of every location (index 0 is unused) of a random connected graph on n locations:
+    a random spanning tree plus extra_edges more random passages."""
+    exits = [{} for _ in range(n + 1)]
+
+    def connect(a: int, b: int) -> None:
+        if a != b and b not in exits[a].values():
+            exits[a][f"go passage {len(exits[a]) + 1}"] = b
+            exits[b][f"go passage {len(exits[b]) + 1}"] = a
+
+    for loc_id in range(2, n + 1):
+        connect(loc_id, rng.randint(1, loc_id - 1))
+    for _ in range(extra_edges):
+        connect(rng.randint(1, n), rng.randint(1, n))
+    return exits
+
+
+def _description(loc_id: int, length: int) -> str:
+    """Return a long description of location loc_id of about the given length."""
+    text = f"\n\tYou are in Room {loc_id}. "
+    return text + (FILLER * (length // len(FILLER) + 1))[:max(0, length - len(text))] + "\n"
+
+
+def generate_world(filename: str, n_locations: int, topology: str = 'grid', n_items: int = 4, n_puzzles: int = 4,
+                   seed: Optional[int] = 0, description_length: int = 200) -> int:
+    """Write a synthetic game data file with the given number of locations, items and puzzles to filename and
+    return the id of its starting location.
+
+    Locations are written one at a time, so only the (small) exits of a random graph are held in memory.
+
+    Preconditions:
+        - n_locations > n_items + n_puzzles
+        - topology in TOPOLOGIES
+
+    >>> import os, tempfile
+    >>> from adventure import AdventureGame
+    >>> path = os.path.join(tempfile.mkdtemp(), 'world.json')
+    >>> start = generate_world(path, 1000, 'random', n_items=5, n_puzzles=3)
+    >>> game = AdventureGame(path, start)
+    >>> len(game.world.locations), sum(item.target_points for item in game.world.items.values())
+    (1000, 20)
+    """
+    rng = random.Random(seed)
+    width = math.ceil(math.sqrt(n_locations))
+    graph = _random_graph(n_locations, n_locations // 2, rng) if topology == 'random' else None
+
+    spots = rng.sample(range(START + 1, n_locations + 1), n_items + n_puzzles)
+    item_spots, puzzle_spots = spots[:n_items], spots[n_items:]
+    if n_items <= WIN_SCORE:
+        points = [WIN_SCORE // n_items + (i < WIN_SCORE % n_items) for i in range(n_items)] if n_items else []
+    else:
+        points = [1] * n_items
+    items = [{"name": f"item {i + 1}", "description": f"Item number {i + 1}, which belongs in Room {START}.\n",
+              "start_position": loc_id, "target_position": START, "target_points": points[i]}
+             for i, loc_id in enumerate(item_spots)]
+    items_at = {item["start_position"]: item["name"] for item in items}
+    puzzles = [{"name": "submit project", "kind": "submit", "command": "submit project", "prompt": "", "loc": START,
+                "win": "\nYou submitted it!\nYou win!\n", "next_loc": START,
+                "lose": "\nYou don't have everything you need yet.\n", "answer": [], "dialogue": ""}]
+    for loc_id in puzzle_spots:
+        code = f"{rng.randint(0, 9999):04d}"
+        puzzles.append({"name": "back door", "kind": "door", "command": "use back door", "prompt": "What's the code? ",
+                        "loc": loc_id, "win": "\nThe door swings open.\n", "next_loc": rng.randint(1, n_locations),
+                        "lose": "Wrong code!", "answer": [code],
+                        "dialogue": f"\nA locked door. Someone has scribbled {code} next to the keypad.\n"})
+    doors = set(puzzle_spots)
+
+    def locations() -> Iterator[dict]:
+        for loc_id in range(1, n_locations + 1):
+            commands = graph[loc_id] if graph is not None else _grid_exits(loc_id, n_locations, width)
+            commands = dict(commands)
+            if loc_id == START:
+                commands["submit project"] = START
+            if loc_id in items_at:
+                commands[f"pickup {items_at[loc_id]}"] = loc_id
+            if loc_id in doors:
+                commands["use back door"] = loc_id
+            yield {"id": loc_id, "name": f"Room {loc_id}",
+                   "brief_description": f"\n\tYou are in Room {loc_id}.\n",
+                   "long_description": _description(loc_id, description_length),
+                   "available_commands": commands, "items": [items_at[loc_id]] if loc_id in items_at else []}
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write('{\n  "locations": [\n')
+        for i, location in enumerate(locations()):
+            f.write(("    " if i == 0 else ",\n    ") + json.dumps(location))
+        f.write('\n  ],\n  "items": ' + json.dumps(items) + ',\n  "puzzles": ' + json.dumps(puzzles) + '\n}\n')
+    return START
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    parser = argparse.ArgumentParser(description="Write a synthetic game data file for scale testing.")
+    parser.add_argument('output', help="game data file to write")
+    parser.add_argument('--locations', type=int, default=1000, help="number of locations (default: 1000)")
+    parser.add_argument('--topology', choices=TOPOLOGIES, default='grid', help="how locations are joined")
+    parser.add_argument('--items', type=int, default=4, help="number of items (default: 4)")
+    parser.add_argument('--puzzles', type=int, default=4, help="number of locked doors (default: 4)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument('--description-length', type=int, default=200,
+                        help="characters in each long description (default: 200)")
+    parser.add_argument('--binary', metavar='FILE', help="also compile the world to this binary world file")
+    args = parser.parse_args()
+
+    start_id = generate_world(args.output, args.locations, args.topology, args.items, args.puzzles, args.seed,
+                              args.description_length)
+    if args.binary:
+        from binary_world import compile_world
+        compile_world(args.output, args.binary)
+    print(f"wrote {args.locations} locations to {args.output}; start at location {start_id}")